@@ -1,3 +1,7 @@
+import struct
+import sys
+from array import array
+
 # ---------------------------------------------------------
 # Binomial Node
 # ---------------------------------------------------------
@@ -10,6 +14,97 @@ class BinomialNode:
         self.degree = 0
 
 
+# ---------------------------------------------------------
+# Iterative walk: (node, depth) for every node reachable from
+# node through child / sibling links, each node before its
+# children and its children before its next sibling (the
+# order the old recursive print_tree used)
+# ---------------------------------------------------------
+def walk(node):
+    stack = []
+    depth = 0
+    while node is not None or stack:
+        if node is None:
+            node, depth = stack.pop()
+        yield node, depth
+        if node.sibling is not None:
+            stack.append((node.sibling, depth))
+        node = node.child
+        depth += 1
+
+
+# ---------------------------------------------------------
+# Binary serialization (integer keys)
+#   header : b"BNH1", node count
+#   body   : int64 keys in walk order, then one degree byte
+#            per node; a node of degree d is followed by its
+#            d children (degrees d-1 … 0), so the layout
+#            rebuilds in one O(n) pass
+# ---------------------------------------------------------
+HEAP_MAGIC = b"BNH1"
+HEAP_HEADER = struct.Struct("<4sQ")
+
+
+def dump_heap(head):
+    keys = array("q")
+    degrees = bytearray()
+    for node, _ in walk(head):
+        keys.append(node.key)
+        degrees.append(node.degree)
+    if sys.byteorder == "big":
+        keys.byteswap()
+    return HEAP_HEADER.pack(HEAP_MAGIC, len(keys)) + keys.tobytes() + bytes(degrees)
+
+
+def load_heap(data, make_node):
+    """Returns the head of the restored root list"""
+
+    if len(data) < HEAP_HEADER.size:
+        raise ValueError("data too short for a binomial heap header")
+    magic, n = HEAP_HEADER.unpack_from(data)
+    if magic != HEAP_MAGIC:
+        raise ValueError("not a serialized binomial heap")
+
+    pos = HEAP_HEADER.size
+    keys = array("q")
+    keys.frombytes(data[pos:pos + 8 * n])
+    degrees = data[pos + 8 * n:]
+    if len(keys) != n or len(degrees) != n:
+        raise ValueError("truncated binomial heap data")
+    if sys.byteorder == "big":
+        keys.byteswap()
+
+    head = tail = None
+    stack = []          # [parent, children still to read, last child]
+    for key, degree in zip(keys, degrees):
+        node = make_node(key)
+        node.degree = degree
+
+        if stack:
+            entry = stack[-1]
+            node.parent = entry[0]
+            if entry[2] is None:
+                entry[0].child = node
+            else:
+                entry[2].sibling = node
+            entry[2] = node
+            entry[1] -= 1
+            if entry[1] == 0:
+                stack.pop()
+        elif head is None:
+            head = tail = node
+        else:
+            tail.sibling = node
+            tail = node
+
+        if degree:
+            stack.append([node, degree, None])
+
+    if stack:
+        raise ValueError("corrupt binomial heap data (missing children)")
+    return head
+
+
 # ---------------------------------------------------------
 # Binomial Heap
 # ---------------------------------------------------------
@@ -116,19 +211,27 @@ class BinomialHeap:
     def print_heap(self):
         print("\nBinomial Heap:")
 
-        def print_tree(node, depth):
-            while node:
-                print("  " * depth + f"- {node.key} (deg {node.degree})")
-                if node.child:
-                    print_tree(node.child, depth + 1)
-                node = node.sibling
-
         if self.head is None:
             print("[empty]")
-        else:
-            print_tree(self.head, 0)
+        for node, depth in walk(self.head):
+            print("  " * depth + f"- {node.key} (deg {node.degree})")
         print("")
 
+    # -----------------------------------------------------
+    # Checkpoint / Restore
+    # -----------------------------------------------------
+    def keys(self):
+        return [node.key for node, _ in walk(self.head)]
+
+    def dumps(self):
+        return dump_heap(self.head)
+
+    @classmethod
+    def loads(cls, data):
+        heap = cls()
+        heap.head = load_heap(data, BinomialNode)
+        return heap
+
 
 # ---------------------------------------------------------
 # MAIN (User Input)
@@ -1,3 +1,5 @@
+from binomial_heap import walk, dump_heap, load_heap
+
 # ---------------------------------------------------------
 # Binomial Node
 # ---------------------------------------------------------
@@ -183,19 +185,13 @@ class BinomialHeap:
             parent = node.parent
 
     # -----------------------------------------------------
-    # Find a key (DFS)
+    # Find a key (iterative DFS, see binomial_heap.walk)
     # -----------------------------------------------------
     def find(self, root, key):
-        if not root:
-            return None
-        if root.key == key:
-            return root
-
-        res = self.find(root.child, key)
-        if res:
-            return res
-
-        return self.find(root.sibling, key)
+        for node, _ in walk(root):
+            if node.key == key:
+                return node
+        return None
 
     # -----------------------------------------------------
     # Print heap structure
@@ -203,18 +199,23 @@ class BinomialHeap:
     def print_heap(self):
         print("\nBinomial Heap:")
 
-        def print_tree(node, depth):
-            while node:
-                print("  " * depth + f"- {node.key} (deg {node.degree})")
-                if node.child:
-                    print_tree(node.child, depth + 1)
-                node = node.sibling
-
         if self.head is None:
             print("[empty]")
-        else:
-            print_tree(self.head, 0)
+        for node, depth in walk(self.head):
+            print("  " * depth + f"- {node.key} (deg {node.degree})")
         print("")
+
+    # -----------------------------------------------------
+    # Checkpoint / Restore (layout in binomial_heap)
+    # -----------------------------------------------------
+    def dumps(self):
+        return dump_heap(self.head)
+
+    @classmethod
+    def loads(cls, data):
+        heap = cls()
+        heap.head = load_heap(data, BinomialNode)
+        return heap
         
 
 # ---------------------------------------------------------
@@ -1,5 +1,7 @@
 from collections import deque
 
+from flow_decomposition import residual_min_cut, decompose_flow
+
 # -------------------------------------------------------
 # Using Max Flow (Ford–Fulkerson with BFS → Edmonds–Karp)
 # -------------------------------------------------------
@@ -7,9 +9,11 @@ class MaxFlow:
     def __init__(self, vertices):
         self.V = vertices
         self.graph = [[0] * vertices for _ in range(vertices)]
+        self.capacity = {}      # original capacities by (u, v)
 
     def add_edge(self, u, v, capacity):
         self.graph[u][v] = capacity
+        self.capacity[(u, v)] = capacity
 
     def bfs(self, s, t, parent):
         visited = [False] * self.V
@@ -27,18 +31,21 @@ class MaxFlow:
                         return True
         return False
 
-    def edmonds_karp(self, source, sink):
+    # hooks: optional object with on_augment(path_length, bottleneck)
+    def edmonds_karp(self, source, sink, hooks=None):
         parent = [-1] * self.V
         max_flow = 0
 
         while self.bfs(source, sink, parent):
             path_flow = float("inf")
+            path_length = 0
             v = sink
 
             # Find minimum residual capacity
             while v != source:
                 u = parent[v]
                 path_flow = min(path_flow, self.graph[u][v])
+                path_length += 1
                 v = u
 
             max_flow += path_flow
@@ -51,24 +58,167 @@ class MaxFlow:
                 self.graph[v][u] += path_flow
                 v = u
 
+            if hooks is not None:
+                hooks.on_augment(path_length, path_flow)
+
+        return max_flow
+
+    # Solve entry point shared with Dinic
+    def max_flow(self, source, sink, hooks=None):
+        return self.edmonds_karp(source, sink, hooks)
+
+    # Original edges as (u, v, capacity, flow) after edmonds_karp
+    def edge_flows(self):
+        for (u, v), c in self.capacity.items():
+            yield u, v, c, max(0, c - self.graph[u][v])
+
+    def residual_neighbors(self, u):
+        return [v for v in range(self.V) if self.graph[u][v] > 0]
+
+    # Min cut from the final residual graph: (source side, cut edges)
+    def min_cut(self, source):
+        return residual_min_cut(self.V, self.residual_neighbors,
+                                self.edge_flows(), source)
+
+    # Final flow split into s-t paths and cycles
+    def flow_decomposition(self, source, sink):
+        return decompose_flow(self.V, self.edge_flows(), source, sink)
+
+
+# -------------------------------------------------------
+# Dinic's Algorithm (BFS level graph + blocking flow)
+# -------------------------------------------------------
+class Dinic:
+    def __init__(self, vertices):
+        self.V = vertices
+        # edge e and e ^ 1 are a forward/reverse residual pair
+        self.adj = [[] for _ in range(vertices)]
+        self.to = []
+        self.cap = []
+        self.level = [-1] * vertices
+
+    def add_edge(self, u, v, capacity):
+        self.adj[u].append(len(self.to))
+        self.to.append(v)
+        self.cap.append(capacity)
+
+        self.adj[v].append(len(self.to))
+        self.to.append(u)
+        self.cap.append(0)
+
+    # Build level graph, True if sink is reachable
+    def bfs(self, s, t):
+        level = [-1] * self.V
+        level[s] = 0
+        queue = deque([s])
+
+        while queue:
+            u = queue.popleft()
+            for e in self.adj[u]:
+                v = self.to[e]
+                if level[v] < 0 and self.cap[e] > 0:
+                    level[v] = level[u] + 1
+                    queue.append(v)
+
+        self.level = level
+        return level[t] >= 0
+
+    # Blocking flow: iterative DFS with current-arc pointers
+    def blocking_flow(self, s, t, hooks=None):
+        adj, to, cap, level = self.adj, self.to, self.cap, self.level
+        it = [0] * self.V
+        flow = 0
+        path = []       # edge ids from s to the current vertex
+        u = s
+
+        while True:
+            if u == t:
+                # Augment by the bottleneck, retreat to first saturated edge
+                path_flow = min(cap[e] for e in path)
+                cut = len(path)
+                for i, e in enumerate(path):
+                    cap[e] -= path_flow
+                    cap[e ^ 1] += path_flow
+                    if cap[e] == 0 and i < cut:
+                        cut = i
+                flow += path_flow
+                if hooks is not None:
+                    hooks.on_augment(len(path), path_flow)
+                del path[cut:]
+                u = to[path[-1]] if path else s
+                continue
+
+            edges = adj[u]
+            advanced = False
+            while it[u] < len(edges):
+                e = edges[it[u]]
+                v = to[e]
+                if cap[e] > 0 and level[v] == level[u] + 1:
+                    path.append(e)
+                    u = v
+                    advanced = True
+                    break
+                it[u] += 1
+
+            if advanced:
+                continue
+
+            # Dead end: drop u from the level graph and retreat
+            level[u] = -1
+            if not path:
+                return flow
+            e = path.pop()
+            u = to[e ^ 1]
+            it[u] += 1
+
+    # hooks: optional object with on_augment(path_length, bottleneck)
+    def max_flow(self, source, sink, hooks=None):
+        max_flow = 0
+        while self.bfs(source, sink):
+            max_flow += self.blocking_flow(source, sink, hooks)
         return max_flow
 
 
+    # Original edges as (u, v, capacity, flow) after max_flow
+    def edge_flows(self):
+        for e in range(0, len(self.to), 2):
+            yield self.to[e ^ 1], self.to[e], self.cap[e] + self.cap[e ^ 1], self.cap[e ^ 1]
+
+    def residual_neighbors(self, u):
+        return [self.to[e] for e in self.adj[u] if self.cap[e] > 0]
+
+    # Min cut from the final residual graph: (source side, cut edges)
+    def min_cut(self, source):
+        return residual_min_cut(self.V, self.residual_neighbors,
+                                self.edge_flows(), source)
+
+    # Final flow split into s-t paths and cycles
+    def flow_decomposition(self, source, sink):
+        return decompose_flow(self.V, self.edge_flows(), source, sink)
+
+
 # -------------------------------------------------------
 # Convert Bipartite Graph → Flow Network
 # -------------------------------------------------------
-def max_bipartite_matching(U, V, edges):
+FLOW_METHODS = {"edmonds_karp": MaxFlow, "dinic": Dinic}
+
+
+def max_bipartite_matching(U, V, edges, method="edmonds_karp"):
     """
     U = number of left partition nodes
     V = number of right partition nodes
     edges = list of (u, v) pairs meaning u ∈ U connects to v ∈ V
+    method = "edmonds_karp" (dense MaxFlow) or "dinic" (O(E√V)),
+             anything else raises ValueError
     """
 
     total_nodes = U + V + 2
     source = U + V      # virtual source
     sink = U + V + 1    # virtual sink
 
-    mf = MaxFlow(total_nodes)
+    if method not in FLOW_METHODS:
+        raise ValueError(f"unknown method '{method}', expected one of {sorted(FLOW_METHODS)}")
+    mf = FLOW_METHODS[method](total_nodes)
 
     # connect source → U partition
     for u in range(U):
@@ -82,8 +232,85 @@ def max_bipartite_matching(U, V, edges):
     for u, v in edges:
         mf.add_edge(u, U + v, 1)
 
-    max_match = mf.edmonds_karp(source, sink)
-    return max_match
+    return mf.max_flow(source, sink)
+
+
+# -------------------------------------------------------
+# Hopcroft–Karp (direct on the edge list, O(E√V))
+# -------------------------------------------------------
+def hopcroft_karp(U, V, edges):
+    """
+    Same arguments as max_bipartite_matching, but returns the
+    matching itself as a list of (u, v) pairs.
+    """
+
+    adj = [[] for _ in range(U)]
+    for u, v in edges:
+        adj[u].append(v)
+
+    match_u = [-1] * U
+    match_v = [-1] * V
+
+    while True:
+        # BFS layers from all free left vertices, stopping at the
+        # first layer that reaches a free right vertex (free_layer,
+        # the usual dist[NIL]): only shortest paths are augmented
+        dist = [-1] * U
+        queue = deque()
+        for u in range(U):
+            if match_u[u] == -1:
+                dist[u] = 0
+                queue.append(u)
+
+        free_layer = None
+        while queue:
+            u = queue.popleft()
+            if free_layer is not None and dist[u] >= free_layer:
+                break
+            for v in adj[u]:
+                w = match_v[v]
+                if w == -1:
+                    if free_layer is None:
+                        free_layer = dist[u] + 1
+                elif dist[w] == -1:
+                    dist[w] = dist[u] + 1
+                    queue.append(w)
+
+        if free_layer is None:
+            break
+
+        # Iterative DFS along the layers for a maximal set of
+        # vertex-disjoint shortest augmenting paths
+        it = [0] * U
+        for root in range(U):
+            if match_u[root] != -1:
+                continue
+
+            stack = [root]
+            while stack:
+                u = stack[-1]
+                if it[u] == len(adj[u]):
+                    dist[u] = -1        # dead end for this phase
+                    stack.pop()
+                    continue
+
+                v = adj[u][it[u]]
+                it[u] += 1
+                w = match_v[v]
+
+                if w == -1:
+                    if dist[u] + 1 != free_layer:
+                        continue
+                    # Flip the alternating path recorded on the stack
+                    for x in stack:
+                        y = adj[x][it[x] - 1]
+                        match_u[x] = y
+                        match_v[y] = x
+                    break
+                if dist[w] == dist[u] + 1 < free_layer:
+                    stack.append(w)
+
+    return [(u, match_u[u]) for u in range(U) if match_u[u] != -1]
 
 
 # -------------------------------------------------------
@@ -104,3 +331,11 @@ if __name__ == "__main__":
     ]
 
     print("Maximum Bipartite Matching:", max_bipartite_matching(U, V, edges))
+    print("Maximum Bipartite Matching (Dinic):",
+          max_bipartite_matching(U, V, edges, method="dinic"))
+
+    # Hopcroft–Karp returns the pairs; flow value is the cross-check
+    matching = hopcroft_karp(U, V, edges)
+    print("Hopcroft–Karp Matching:", matching)
+    print("Matches flow result:",
+          len(matching) == max_bipartite_matching(U, V, edges))
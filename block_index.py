@@ -0,0 +1,171 @@
+from bisect import bisect_left, bisect_right, insort_right
+
+# ---------------------------------------------------------
+# Block Index: an ordered index kept as a list of sorted
+# Python lists ("blocks") of at most 2 * load keys each
+#   lookups = bisect over the block maxima + bisect inside
+#   one block, both running in C over contiguous arrays,
+#   instead of one Python-level pointer hop per tree level
+#   insert / delete shift at most 2 * load entries of one
+#   block, so they stay cheap for load in the hundreds
+# Same insert / delete / search / iter_range methods as the
+# RedBlackTree in rbt_delete (duplicates allowed, equal
+# keys go after the existing ones), except that there are
+# no nodes to hand out:
+#   search returns True / False, not a node or the sentinel
+#   delete returns True / False instead of printing
+#   "Key not found!" and returning None
+# so code written for both should use `in` and ignore the
+# result of delete (see rbt_vs_block_index)
+# ---------------------------------------------------------
+class BlockIndex:
+    def __init__(self, load=512):
+        self.load = load
+        self.blocks = []        # sorted, non-empty lists
+        self.maxes = []         # maxes[i] == blocks[i][-1]
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    @classmethod
+    def from_sorted(cls, keys, load=512):
+        index = cls(load)
+        keys = list(keys)
+        for i in range(1, len(keys)):
+            if keys[i] < keys[i - 1]:
+                raise ValueError("from_sorted() needs keys in sorted order")
+
+        index.blocks = [keys[i:i + load] for i in range(0, len(keys), load)]
+        index.maxes = [block[-1] for block in index.blocks]
+        index.size = len(keys)
+        return index
+
+    @classmethod
+    def from_iterable(cls, keys, load=512):
+        return cls.from_sorted(sorted(keys), load)
+
+    # -----------------------------------------------------
+    # Insert
+    # -----------------------------------------------------
+    def insert(self, key):
+        if not self.blocks:
+            self.blocks.append([key])
+            self.maxes.append(key)
+            self.size = 1
+            return
+
+        i = bisect_right(self.maxes, key)
+        if i == len(self.maxes):
+            # larger than everything: append to the last block
+            i -= 1
+            self.blocks[i].append(key)
+            self.maxes[i] = key
+        else:
+            insort_right(self.blocks[i], key)
+        self.size += 1
+
+        block = self.blocks[i]
+        if len(block) > 2 * self.load:
+            half = block[self.load:]
+            del block[self.load:]
+            self.blocks.insert(i + 1, half)
+            self.maxes[i] = block[-1]
+            self.maxes.insert(i + 1, half[-1])
+
+    # -----------------------------------------------------
+    # Delete (one occurrence); True if key was present
+    # -----------------------------------------------------
+    def delete(self, key):
+        i = bisect_left(self.maxes, key)
+        if i == len(self.maxes):
+            return False
+        block = self.blocks[i]
+        j = bisect_left(block, key)
+        if block[j] != key:
+            return False
+
+        del block[j]
+        self.size -= 1
+        if not block:
+            del self.blocks[i]
+            del self.maxes[i]
+            return True
+        self.maxes[i] = block[-1]
+
+        # Merge underfull blocks so the block count stays ~ n / load
+        if len(block) < self.load // 2 and len(self.blocks) > 1:
+            if i == len(self.blocks) - 1:
+                i -= 1
+            self.blocks[i] += self.blocks[i + 1]
+            del self.blocks[i + 1]
+            del self.maxes[i]
+            self.maxes[i] = self.blocks[i][-1]
+            if len(self.blocks[i]) > 2 * self.load:
+                block = self.blocks[i]
+                half = block[len(block) // 2:]
+                del block[len(block) // 2:]
+                self.blocks.insert(i + 1, half)
+                self.maxes[i] = block[-1]
+                self.maxes.insert(i + 1, half[-1])
+        return True
+
+    # -----------------------------------------------------
+    # Search / Range
+    # -----------------------------------------------------
+    def search(self, key):
+        i = bisect_left(self.maxes, key)
+        if i == len(self.maxes):
+            return False
+        block = self.blocks[i]
+        return block[bisect_left(block, key)] == key
+
+    def __contains__(self, key):
+        return self.search(key)
+
+    # Lazily yields keys with lo <= key <= hi in sorted order
+    def iter_range(self, lo=None, hi=None, reverse=False):
+        if not self.blocks:
+            return
+
+        if not reverse:
+            i = 0 if lo is None else bisect_left(self.maxes, lo)
+            j = 0 if lo is None or i == len(self.blocks) else bisect_left(self.blocks[i], lo)
+            for block in self.blocks[i:]:
+                for key in block[j:] if j else block:
+                    if hi is not None and key > hi:
+                        return
+                    yield key
+                j = 0
+        else:
+            i = len(self.blocks) - 1 if hi is None else min(bisect_right(self.maxes, hi), len(self.blocks) - 1)
+            j = len(self.blocks[i]) if hi is None else bisect_right(self.blocks[i], hi)
+            while i >= 0:
+                block = self.blocks[i]
+                for k in range(j - 1, -1, -1):
+                    if lo is not None and block[k] < lo:
+                        return
+                    yield block[k]
+                i -= 1
+                j = len(self.blocks[i]) if i >= 0 else 0
+
+    def __iter__(self):
+        return self.iter_range()
+
+    def __reversed__(self):
+        return self.iter_range(reverse=True)
+
+
+# ---------------------------------------------------------
+# Example
+# ---------------------------------------------------------
+if __name__ == "__main__":
+    index = BlockIndex(load=4)
+    for x in [20, 15, 25, 10, 5, 1, 30, 12, 18, 22, 15]:
+        index.insert(x)
+
+    print("Blocks:", index.blocks)
+    print("Search 18:", index.search(18))
+    print("Keys in [10, 22]:", list(index.iter_range(10, 22)))
+    print("Delete 15:", index.delete(15), "Delete 99:", index.delete(99))
+    print("All keys:", list(index))
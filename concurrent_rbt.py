@@ -0,0 +1,248 @@
+import random
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+from rbt_delete import RedBlackTree
+
+# ---------------------------------------------------------
+# Readers-Writer Lock (one Condition, writer preference)
+#   any number of readers share the lock, a writer holds it
+#   alone; once a writer is waiting no new reader gets in,
+#   so a steady stream of lookups cannot starve updates
+# ---------------------------------------------------------
+class ReadWriteLock:
+    def __init__(self):
+        self.cond = threading.Condition()
+        self.readers = 0
+        self.writer = False
+        self.waiting_writers = 0
+
+    def acquire_read(self):
+        with self.cond:
+            while self.writer or self.waiting_writers:
+                self.cond.wait()
+            self.readers += 1
+
+    def release_read(self):
+        with self.cond:
+            self.readers -= 1
+            if self.readers == 0:
+                self.cond.notify_all()
+
+    def acquire_write(self):
+        with self.cond:
+            self.waiting_writers += 1
+            while self.writer or self.readers:
+                self.cond.wait()
+            self.waiting_writers -= 1
+            self.writer = True
+
+    def release_write(self):
+        with self.cond:
+            self.writer = False
+            self.cond.notify_all()
+
+    @contextmanager
+    def read_locked(self):
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write_locked(self):
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+# ---------------------------------------------------------
+# Thread-safe wrapper around rbt_delete.RedBlackTree
+#   reads (search / range / rank ...) share the read lock,
+#   insert / delete take the write lock, so no reader ever
+#   sees a tree halfway through a rotation
+#   queue_insert / queue_delete buffer updates; flush()
+#   applies the whole buffer in one write critical section
+#   (one lock round trip per batch instead of per update),
+#   automatically once batch_size updates are pending
+# Reads return plain values (bools, key lists), never nodes,
+# so nothing escapes the lock
+# ---------------------------------------------------------
+class ConcurrentRedBlackTree:
+    def __init__(self, tree=None, batch_size=None):
+        self.tree = RedBlackTree() if tree is None else tree
+        self.lock = ReadWriteLock()
+        self.batch_size = batch_size
+        self.pending = []                   # ("insert" | "delete", key)
+        self.pending_lock = threading.Lock()
+
+    # ---- Reads ----
+    def search(self, key):
+        with self.lock.read_locked():
+            return self.tree.search(key) != self.tree.NULL
+
+    def __contains__(self, key):
+        return self.search(key)
+
+    def __len__(self):
+        with self.lock.read_locked():
+            return len(self.tree)
+
+    # Keys with lo <= key <= hi, materialized under the lock
+    def range(self, lo=None, hi=None):
+        with self.lock.read_locked():
+            return list(self.tree.iter_range(lo, hi))
+
+    def rank(self, key):
+        with self.lock.read_locked():
+            return self.tree.rank(key)
+
+    def select(self, k):
+        with self.lock.read_locked():
+            return self.tree.select(k)
+
+    # ---- Immediate writes ----
+    def insert(self, key):
+        with self.lock.write_locked():
+            self.tree.insert(key)
+
+    # True if key was present
+    def delete(self, key):
+        with self.lock.write_locked():
+            return self.delete_locked(key)
+
+    def delete_locked(self, key):
+        node = self.tree.search(key)
+        if node == self.tree.NULL:
+            return False
+        self.tree.delete_node(node)
+        return True
+
+    # ---- Batched writes ----
+    def queue_insert(self, key):
+        self.queue("insert", key)
+
+    def queue_delete(self, key):
+        self.queue("delete", key)
+
+    def queue(self, op, key):
+        with self.pending_lock:
+            self.pending.append((op, key))
+            full = self.batch_size is not None and len(self.pending) >= self.batch_size
+        if full:
+            self.flush()
+
+    # Applies every queued update in order; returns how many.
+    # The batch is taken out under the write lock, so two flushes
+    # cannot apply their batches in the opposite order
+    def flush(self):
+        with self.pending_lock:
+            if not self.pending:
+                return 0
+
+        # Plain inserts: insert_many only beats them once the batch
+        # is about as large as the tree itself
+        with self.lock.write_locked():
+            with self.pending_lock:
+                batch, self.pending = self.pending, []
+            for op, key in batch:
+                if op == "insert":
+                    self.tree.insert(key)
+                else:
+                    self.delete_locked(key)
+        return len(batch)
+
+
+# ---------------------------------------------------------
+# Contention benchmark: lookups/sec as reader threads scale,
+# with one writer thread doing write_rate updates/sec
+# (bursts of inserts, then deletes of random keys)
+# (CPython's GIL serializes the lookups themselves, so this
+#  measures what the locking costs and how the writer
+#  competes, not parallel speedup)
+# ---------------------------------------------------------
+def contention_benchmark(n, readers, duration, batched, write_rate=20000):
+    index = ConcurrentRedBlackTree(RedBlackTree.from_sorted(range(0, 2 * n, 2)),
+                                   batch_size=256 if batched else None)
+    stop = threading.Event()
+    lookups = [0] * readers
+    writes = [0]
+
+    def reader(slot):
+        rng = random.Random(slot)
+        done = 0
+        while not stop.is_set():
+            for _ in range(100):
+                index.search(rng.randrange(2 * n))
+            done += 100
+        lookups[slot] = done
+
+    def writer():
+        rng = random.Random(-1)
+        burst = max(2, write_rate // 100)       # every 10 ms: inserts + deletes
+        next_burst = time.time()
+        while not stop.is_set():
+            keys = [rng.randrange(2 * n) for _ in range(burst // 2)]
+            doomed = [rng.randrange(2 * n) for _ in range(burst // 2)]
+            if batched:
+                for key in keys:
+                    index.queue_insert(key)
+                for key in doomed:
+                    index.queue_delete(key)
+            else:
+                for key in keys:
+                    index.insert(key)
+                for key in doomed:
+                    index.delete(key)
+            writes[0] += 2 * (burst // 2)
+
+            next_burst += 0.01
+            delay = next_burst - time.time()
+            if delay > 0:
+                time.sleep(delay)
+        index.flush()
+
+    threads = [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+    threads.append(threading.Thread(target=writer))
+    for th in threads:
+        th.start()
+    time.sleep(duration)
+    stop.set()
+    for th in threads:
+        th.join()
+
+    index.tree.verify_properties()
+    return sum(lookups) / duration, writes[0] / duration
+
+
+# ---------------------------------------------------------
+# MAIN
+# ---------------------------------------------------------
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    duration = float(sys.argv[2]) if len(sys.argv) > 2 else 1.0
+
+    print("Concurrent Red-Black Tree: lookups/sec vs reader threads")
+    print("--------------------------------------------------------")
+
+    tree = RedBlackTree.from_sorted(range(0, 2 * n, 2))
+    rng = random.Random(0)
+    count = 0
+    start = time.time()
+    while time.time() - start < duration:
+        for _ in range(100):
+            tree.search(rng.randrange(2 * n))
+        count += 100
+    print(f"Unsynchronized, 1 thread, no writer : {count / duration:12.0f} lookups/sec\n")
+
+    print(f"{'readers':>7s} | {'writes':>8s} | {'lookups/sec':>12s} | {'writes/sec':>10s}")
+    for readers in (1, 2, 4, 8):
+        for batched in (False, True):
+            reads, writes = contention_benchmark(n, readers, duration, batched)
+            mode = "batched" if batched else "direct"
+            print(f"{readers:7d} | {mode:>8s} | {reads:12.0f} | {writes:10.0f}")
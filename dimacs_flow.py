@@ -0,0 +1,171 @@
+import gzip
+import os
+import sys
+import tempfile
+import time
+
+from ford_fulkerson import Graph
+from bipartite_matching_flow import Dinic
+from push_relabel import PushRelabel
+
+# -------------------------------------------------------
+# DIMACS max-flow format
+#   c <comment>
+#   p max <nodes> <arcs>
+#   n <id> s | n <id> t
+#   a <u> <v> <capacity>
+# Node ids are 1-based in the file, 0-based in the solvers.
+# -------------------------------------------------------
+def open_text(path, mode):
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t")
+    return open(path, mode)
+
+
+# Field count of each line type (including the type letter)
+FIELDS = {"p": 4, "n": 3, "a": 4}
+
+
+def parse_int(field, line_no):
+    try:
+        return int(field)
+    except ValueError:
+        raise ValueError(f"line {line_no}: '{field}' is not an integer") from None
+
+
+# 1-based id from the file -> 0-based vertex, range-checked
+def parse_node(field, line_no, nodes):
+    node = parse_int(field, line_no)
+    if not 1 <= node <= nodes:
+        raise ValueError(f"line {line_no}: node id {node} outside 1..{nodes}")
+    return node - 1
+
+
+def read_dimacs(path, make_solver):
+    """
+    Streams the file line by line: arcs go straight into
+    make_solver(n).add_edge, so no edge list is ever built.
+    make_solver = e.g. lambda n: Graph(n, sparse=True), Dinic, PushRelabel
+    Returns (solver, source, sink).
+    """
+
+    solver = None
+    source = sink = None
+    arcs = 0
+
+    with open_text(path, "r") as f:
+        for line_no, line in enumerate(f, 1):
+            if not line.strip() or line[0] == "c":
+                continue
+
+            parts = line.split()
+            kind = parts[0]
+            if kind not in FIELDS:
+                raise ValueError(f"line {line_no}: unknown line type '{kind}'")
+            if len(parts) != FIELDS[kind]:
+                raise ValueError(f"line {line_no}: '{kind}' line needs "
+                                 f"{FIELDS[kind] - 1} fields, got {len(parts) - 1}")
+            if kind != "p" and solver is None:
+                raise ValueError(f"line {line_no}: '{kind}' line before 'p max' line")
+
+            if kind == "a":
+                u = parse_node(parts[1], line_no, nodes)
+                v = parse_node(parts[2], line_no, nodes)
+                capacity = parse_int(parts[3], line_no)
+                if capacity < 0:
+                    raise ValueError(f"line {line_no}: negative capacity {capacity}")
+                solver.add_edge(u, v, capacity)
+                arcs += 1
+            elif kind == "n":
+                node = parse_node(parts[1], line_no, nodes)
+                if parts[2] == "s":
+                    source = node
+                elif parts[2] == "t":
+                    sink = node
+                else:
+                    raise ValueError(f"line {line_no}: node type must be 's' or 't'")
+            elif kind == "p":
+                if solver is not None:
+                    raise ValueError(f"line {line_no}: duplicate 'p' line")
+                if parts[1] != "max":
+                    raise ValueError(f"line {line_no}: not a max-flow problem")
+                nodes = parse_int(parts[2], line_no)
+                expected_arcs = parse_int(parts[3], line_no)
+                if nodes < 1 or expected_arcs < 0:
+                    raise ValueError(f"line {line_no}: bad problem size")
+                solver = make_solver(nodes)
+
+    if solver is None:
+        raise ValueError("missing 'p max' line")
+    if source is None or sink is None:
+        raise ValueError("missing source or sink ('n <id> s/t') line")
+    if arcs != expected_arcs:
+        raise ValueError(f"expected {expected_arcs} arcs, found {arcs}")
+
+    return solver, source, sink
+
+
+def write_dimacs(path, n, edges, source, sink, comment=None):
+    """
+    edges = sequence of (u, v, capacity), 0-based
+    (same shape as the flow_benchmark generators return)
+    """
+
+    with open_text(path, "w") as f:
+        if comment:
+            for line in comment.splitlines():
+                f.write(f"c {line}\n")
+        f.write(f"p max {n} {len(edges)}\n")
+        f.write(f"n {source + 1} s\n")
+        f.write(f"n {sink + 1} t\n")
+        for u, v, c in edges:
+            f.write(f"a {u + 1} {v + 1} {c}\n")
+
+
+# -------------------------------------------------------
+# Solvers that can be fed from a file
+# -------------------------------------------------------
+SOLVERS = {
+    "ford_fulkerson": (lambda n: Graph(n, sparse=True),
+                       lambda g, s, t: g.ford_fulkerson(s, t)),
+    "dinic": (Dinic, lambda g, s, t: g.max_flow(s, t)),
+    "push_relabel": (PushRelabel, lambda g, s, t: g.max_flow_highest_label(s, t)[0]),
+}
+
+
+def solve_dimacs(path, method="dinic"):
+    make_solver, run = SOLVERS[method]
+    solver, source, sink = read_dimacs(path, make_solver)
+    return run(solver, source, sink)
+
+
+# -------------------------------------------------------
+# MAIN: python dimacs_flow.py [file.max[.gz]] [method]
+# -------------------------------------------------------
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        method = sys.argv[2] if len(sys.argv) > 2 else "dinic"
+        start = time.time()
+        print("Maximum Flow:", solve_dimacs(sys.argv[1], method))
+        print(f"Time ({method}): {time.time() - start:.3f} sec")
+        sys.exit()
+
+    # Round trip of the CLRS example network
+    edges = [
+        (0,1,16), (0,2,13),
+        (1,3,12), (2,1,4),
+        (2,4,14), (3,5,20),
+        (4,3,7),  (4,5,4)
+    ]
+
+    fd, path = tempfile.mkstemp(suffix=".max")
+    os.close(fd)
+    try:
+        write_dimacs(path, 6, edges, 0, 5, comment="CLRS example network")
+        with open(path) as f:
+            print(f.read())
+
+        for method in SOLVERS:
+            print(f"Maximum Flow ({method}):", solve_dimacs(path, method))
+    finally:
+        os.remove(path)
@@ -0,0 +1,233 @@
+import csv
+import random
+import sys
+import time
+import tracemalloc
+
+from ford_fulkerson import Graph, FlowStats, random_flow_edges
+from bipartite_matching_flow import MaxFlow
+from push_relabel import PushRelabel
+
+# -------------------------------------------------------
+# Network generators: each returns (n, edges, source, sink)
+# with edges = [(u, v, capacity), ...]
+# -------------------------------------------------------
+def layered_network(layers, width, max_cap=100, degree=3, seed=None):
+    rng = random.Random(seed)
+    n = layers * width + 2
+    s, t = n - 2, n - 1
+    edges = []
+
+    for i in range(width):
+        edges.append((s, i, rng.randint(1, max_cap)))
+        edges.append(((layers - 1) * width + i, t, rng.randint(1, max_cap)))
+
+    for layer in range(layers - 1):
+        for i in range(width):
+            u = layer * width + i
+            for j in rng.sample(range(width), min(degree, width)):
+                edges.append((u, (layer + 1) * width + j, rng.randint(1, max_cap)))
+
+    return n, edges, s, t
+
+
+def grid_network(rows, cols, max_cap=100, seed=None):
+    rng = random.Random(seed)
+    n = rows * cols + 2
+    s, t = n - 2, n - 1
+    edges = []
+
+    for r in range(rows):
+        edges.append((s, r * cols, rng.randint(1, max_cap)))
+        edges.append((r * cols + cols - 1, t, rng.randint(1, max_cap)))
+        for c in range(cols):
+            u = r * cols + c
+            if c + 1 < cols:
+                edges.append((u, u + 1, rng.randint(1, max_cap)))
+            if r + 1 < rows:
+                edges.append((u, u + cols, rng.randint(1, max_cap)))
+                edges.append((u + cols, u, rng.randint(1, max_cap)))
+
+    return n, edges, s, t
+
+
+def random_sparse_network(n, max_cap=100, seed=None):
+    return n, random_flow_edges(n, 4 * n, max_cap, seed), 0, n - 1
+
+
+def random_dense_network(n, max_cap=100, seed=None):
+    return n, random_flow_edges(n, n * (n - 1) // 4, max_cap, seed), 0, n - 1
+
+
+# Unit-capacity matching instance (as in max_bipartite_matching)
+def bipartite_network(U, V, degree=3, seed=None):
+    rng = random.Random(seed)
+    n = U + V + 2
+    s, t = U + V, U + V + 1
+    edges = [(s, u, 1) for u in range(U)] + [(U + v, t, 1) for v in range(V)]
+    for u in range(U):
+        for v in rng.sample(range(V), min(degree, V)):
+            edges.append((u, U + v, 1))
+    return n, edges, s, t
+
+
+# Deep search: the only s-t route is an n-vertex chain, with
+# backward shortcuts the search has to skip (one augmentation
+# of length n - 1 for every solver; stresses search depth and
+# per-augmentation cost, not the number of augmentations)
+def long_path_network(n, seed=None):
+    rng = random.Random(seed)
+    edges = [(i, i + 1, n) for i in range(n - 1)]
+    for _ in range(n):
+        u = rng.randrange(1, n - 1)
+        v = rng.randrange(1, u + 1)
+        if u != v:
+            edges.append((u, v, n))
+    return n, edges, 0, n - 1
+
+
+# k parallel copies of the textbook zig-zag gadget s→a, s→b,
+# a→t, b→t (capacity M) with a unit cross edge a→b. Not a worst
+# case for these solvers: the DFS marks a and b straight from s,
+# so it never routes through the cross edge and needs two
+# augmentations per gadget. Kept as a regression check that no
+# solver starts bouncing flow over the cross edge (which would
+# cost up to 2M augmentations per gadget)
+def zigzag_network(k, M=10**6):
+    n = 2 * k + 2
+    s, t = n - 2, n - 1
+    edges = []
+    for i in range(k):
+        a, b = 2 * i, 2 * i + 1
+        edges += [(s, a, M), (s, b, M), (a, b, 1), (a, t, M), (b, t, M)]
+    return n, edges, s, t
+
+
+# Push–relabel worst case: s→a carries 2 units, a→t only 1,
+# and a also feeds a dead-end chain of k vertices. The extra
+# unit runs down the chain, and with heights starting at 0 and
+# no global relabel it can only get back to s (height n) by
+# relabeling the whole chain up two levels per round trip:
+# Θ(k²) relabels for PushRelabel.max_flow, against one
+# augmentation for the path solvers; the highest-label
+# variant's first global relabel already puts the chain on
+# the source side
+def dead_end_network(k):
+    n = k + 3
+    s, a, t = n - 3, n - 2, n - 1
+    edges = [(s, a, 2), (a, 0, 2)]
+    edges += [(i, i + 1, 2) for i in range(k - 1)]
+    edges.append((a, t, 1))
+    return n, edges, s, t
+
+
+# -------------------------------------------------------
+# Solver runners: build, solve, return (flow, counters)
+# -------------------------------------------------------
+def run_ford_fulkerson(n, edges, s, t):
+    g = Graph(n, sparse=True)
+    for u, v, c in edges:
+        g.add_edge(u, v, c)
+    stats = FlowStats()
+    flow = g.ford_fulkerson(s, t, hooks=stats)
+    return flow, {"augmentations": stats.augmentations}
+
+
+def run_edmonds_karp(n, edges, s, t):
+    mf = MaxFlow(n)
+    for u, v, c in edges:
+        mf.add_edge(u, v, c)
+    stats = FlowStats()
+    flow = mf.edmonds_karp(s, t, hooks=stats)
+    return flow, {"augmentations": stats.augmentations}
+
+
+def run_push_relabel(n, edges, s, t):
+    pr = PushRelabel(n)
+    for u, v, c in edges:
+        pr.add_edge(u, v, c)
+    flow, relabels = pr.max_flow(s, t)
+    return flow, {"relabels": relabels, "pushes": pr.count_pushes}
+
+
+def run_highest_label(n, edges, s, t):
+    pr = PushRelabel(n)
+    for u, v, c in edges:
+        pr.add_edge(u, v, c)
+    flow, relabels = pr.max_flow_highest_label(s, t)
+    return flow, {"relabels": relabels, "pushes": pr.count_pushes}
+
+
+SOLVERS = [
+    ("Graph.ford_fulkerson", run_ford_fulkerson, None),
+    ("MaxFlow.edmonds_karp", run_edmonds_karp, 600),      # dense V×V
+    ("PushRelabel.max_flow", run_push_relabel, None),
+    ("PushRelabel.highest", run_highest_label, None),
+]
+
+FIELDS = ["network", "n", "m", "solver", "flow", "seconds",
+          "augmentations", "relabels", "pushes", "peak_kib"]
+
+
+def benchmark_instance(name, instance):
+    n, edges, s, t = instance
+    rows = []
+
+    for solver, run, max_n in SOLVERS:
+        if max_n is not None and n > max_n:
+            continue
+
+        start = time.perf_counter()
+        flow, counters = run(n, edges, s, t)
+        seconds = time.perf_counter() - start
+
+        # second run under tracemalloc (it slows the timed run down)
+        tracemalloc.start()
+        run(n, edges, s, t)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        row = {"network": name, "n": n, "m": len(edges), "solver": solver,
+               "flow": flow, "seconds": f"{seconds:.6f}",
+               "peak_kib": peak // 1024}
+        row.update(counters)
+        rows.append(row)
+
+    flows = {row["flow"] for row in rows}
+    assert len(flows) == 1, f"solvers disagree on {name}: {flows}"
+    return rows
+
+
+def benchmark_suite(scale=1, seed=0):
+    yield "layered", layered_network(8, 25 * scale, seed=seed)
+    yield "grid", grid_network(10 * scale, 20, seed=seed)
+    yield "random_sparse", random_sparse_network(200 * scale, seed=seed)
+    yield "random_dense", random_dense_network(60 * scale, seed=seed)
+    yield "bipartite", bipartite_network(100 * scale, 100 * scale, seed=seed)
+    yield "long_path", long_path_network(200 * scale, seed=seed)
+    yield "zigzag", zigzag_network(50 * scale)
+    yield "dead_end", dead_end_network(100 * scale)
+
+
+# -------------------------------------------------------
+# MAIN
+# -------------------------------------------------------
+if __name__ == "__main__":
+    out_path = sys.argv[1] if len(sys.argv) > 1 else "flow_benchmark.csv"
+
+    print("Max-Flow Benchmark Suite")
+    print("------------------------")
+    print(f"{'network':14s} {'n':>6s} {'m':>7s}  {'solver':22s} {'flow':>10s} {'sec':>10s} {'KiB':>8s}")
+
+    with open(out_path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+
+        for scale in (1, 2):
+            for name, instance in benchmark_suite(scale):
+                for row in benchmark_instance(name, instance):
+                    writer.writerow(row)
+                    print(f"{row['network']:14s} {row['n']:6d} {row['m']:7d}  {row['solver']:22s} "
+                          f"{row['flow']:10d} {row['seconds']:>10s} {row['peak_kib']:8d}")
+
+    print("\nResults written to", out_path)
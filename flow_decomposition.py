@@ -0,0 +1,117 @@
+# -------------------------------------------------------
+# Min cut + path/cycle decomposition of a final max flow
+# (shared by ford_fulkerson, bipartite_matching_flow and
+#  push_relabel)
+# -------------------------------------------------------
+
+# -------------------------------------------------------
+# Min cut: source side = vertices reachable from s in the
+# residual graph, cut edges = original edges leaving it
+# -------------------------------------------------------
+def residual_min_cut(n, residual_neighbors, edges, source):
+    """
+    residual_neighbors(u) = vertices v with residual capacity u → v
+    edges = iterable of (u, v, capacity, flow) for the original edges
+    """
+
+    seen = [False] * n
+    seen[source] = True
+    stack = [source]
+
+    while stack:
+        u = stack.pop()
+        for v in residual_neighbors(u):
+            if not seen[v]:
+                seen[v] = True
+                stack.append(v)
+
+    source_side = {u for u in range(n) if seen[u]}
+    cut_edges = [(u, v, c) for u, v, c, f in edges
+                 if seen[u] and not seen[v] and c > 0]
+    return source_side, cut_edges
+
+
+# -------------------------------------------------------
+# Flow decomposition into s-t paths and cycles
+# -------------------------------------------------------
+def decompose_flow(n, edges, source, sink):
+    """
+    edges = iterable of (u, v, capacity, flow); only flow > 0 is used
+    Returns (paths, cycles), each a list of (vertex list, amount).
+    """
+
+    out = [[] for _ in range(n)]
+    for u, v, c, f in edges:
+        if f > 0:
+            out[u].append([v, f])
+    ptr = [0] * n
+
+    # next arc out of u that still carries flow (current-arc pointer)
+    def next_arc(u):
+        arcs = out[u]
+        while ptr[u] < len(arcs) and arcs[ptr[u]][1] == 0:
+            ptr[u] += 1
+        return arcs[ptr[u]] if ptr[u] < len(arcs) else None
+
+    paths = []
+    cycles = []
+
+    def peel(vertices, arcs, target):
+        amount = min(a[1] for a in arcs)
+        for a in arcs:
+            a[1] -= amount
+        target.append((vertices, amount))
+
+    # Paths are peeled from the source first, the rest is circulation
+    for start in [source] + list(range(n)):
+        while next_arc(start) is not None:
+            stack = [start]
+            arcs = []
+            pos = {start: 0}
+            u = start
+
+            while True:
+                if start == source and u == sink and arcs:
+                    peel(stack, arcs, paths)
+                    break
+
+                a = next_arc(u)
+                if a is None:
+                    break
+                v = a[0]
+                arcs.append(a)
+
+                if v in pos:
+                    # Walk closed a cycle: peel it and continue from v
+                    i = pos[v]
+                    peel(stack[i:] + [v], arcs[i:], cycles)
+                    for w in stack[i + 1:]:
+                        del pos[w]
+                    del stack[i + 1:]
+                    del arcs[i:]
+                else:
+                    pos[v] = len(stack)
+                    stack.append(v)
+                u = v
+
+    return paths, cycles
+
+
+# -------------------------------------------------------
+# Example
+# -------------------------------------------------------
+if __name__ == "__main__":
+    from ford_fulkerson import create_test_graph
+
+    g = create_test_graph(randomize=False, sparse=True)
+    print("Maximum Flow:", g.ford_fulkerson(0, 5))
+
+    source_side, cut_edges = g.min_cut(0)
+    print("Source side of min cut:", sorted(source_side))
+    print("Cut edges:", cut_edges)
+
+    paths, cycles = g.flow_decomposition(0, 5)
+    for path, amount in paths:
+        print("Path", " → ".join(map(str, path)), "carries", amount)
+    for cycle, amount in cycles:
+        print("Cycle", " → ".join(map(str, cycle)), "carries", amount)
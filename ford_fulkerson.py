@@ -1,20 +1,77 @@
-from collections import defaultdict
+from collections import defaultdict, deque
 import random
+import time
+
+from flow_decomposition import residual_min_cut, decompose_flow
+
+# -------------------------------------------------------
+# Instrumentation hooks (pass as ford_fulkerson(..., hooks=))
+# -------------------------------------------------------
+class FlowStats:
+    def __init__(self):
+        self.augmentations = 0
+        self.path_lengths = []
+        self.bottlenecks = []
+        self.phase_time = defaultdict(float)   # seconds per phase
+
+    # Called once per augmenting path
+    def on_augment(self, path_length, bottleneck):
+        self.augmentations += 1
+        self.path_lengths.append(path_length)
+        self.bottlenecks.append(bottleneck)
+
+    # Called with the time spent in "search" / "augment"
+    def on_phase(self, phase, seconds):
+        self.phase_time[phase] += seconds
+
+    def summary(self):
+        lengths = self.path_lengths or [0]
+        return {
+            "augmentations": self.augmentations,
+            "avg_path_length": sum(lengths) / len(lengths),
+            "max_path_length": max(lengths),
+            "min_bottleneck": min(self.bottlenecks, default=0),
+            "search_time": self.phase_time["search"],
+            "augment_time": self.phase_time["augment"],
+        }
+
 
 # -------------------------------------------------------
 # Graph class using adjacency list for Ford–Fulkerson
 # -------------------------------------------------------
 class Graph:
-    def __init__(self, vertices):
+    def __init__(self, vertices, sparse=False):
         self.V = vertices
-        self.graph = [[0] * vertices for _ in range(vertices)]
+        self.sparse = sparse
 
-    # Add capacity to an edge
+        if sparse:
+            # Residual edges stored in flat arrays; edge e and e ^ 1
+            # are a forward/reverse pair, adj[u] lists edge ids out of u
+            self.adj = [[] for _ in range(vertices)]
+            self.to = []
+            self.cap = []
+        else:
+            self.graph = [[0] * vertices for _ in range(vertices)]
+            self.capacity = {}      # original capacities by (u, v)
+
+    # Add capacity to an edge (repeated u → v edges add up in both
+    # modes, like parallel arcs in a DIMACS file)
     def add_edge(self, u, v, capacity):
-        self.graph[u][v] = capacity
+        if self.sparse:
+            self.adj[u].append(len(self.to))
+            self.to.append(v)
+            self.cap.append(capacity)
+
+            self.adj[v].append(len(self.to))
+            self.to.append(u)
+            self.cap.append(0)
+        else:
+            self.graph[u][v] += capacity
+            self.capacity[(u, v)] = self.capacity.get((u, v), 0) + capacity
 
     # Depth-First Search to find augmenting path
-    def dfs(self, s, t, parent):
+    # (only residual edges >= delta when capacity scaling)
+    def dfs(self, s, t, parent, delta=0):
         visited = [False] * self.V
         stack = [s]
         visited[s] = True
@@ -22,7 +79,7 @@ class Graph:
         while stack:
             u = stack.pop()
             for v in range(self.V):
-                if not visited[v] and self.graph[u][v] > 0:
+                if not visited[v] and self.graph[u][v] > 0 and self.graph[u][v] >= delta:
                     stack.append(v)
                     visited[v] = True
                     parent[v] = u
@@ -30,19 +87,120 @@ class Graph:
                         return True
         return False
 
+    # DFS over residual edge arrays, parent_edge[v] = edge id into v
+    def dfs_sparse(self, s, t, parent_edge, delta=0):
+        visited = [False] * self.V
+        stack = [s]
+        visited[s] = True
+        to = self.to
+        cap = self.cap
+
+        while stack:
+            u = stack.pop()
+            for e in self.adj[u]:
+                v = to[e]
+                if not visited[v] and cap[e] > 0 and cap[e] >= delta:
+                    stack.append(v)
+                    visited[v] = True
+                    parent_edge[v] = e
+                    if v == t:
+                        return True
+        return False
+
+    # Capacity scaling thresholds: 2^k, ..., 2, 1, then a plain pass (0)
+    def scaling_deltas(self):
+        top = max(self.cap if self.sparse else self.capacity.values(), default=0)
+        delta = 1
+        while delta * 2 <= top:
+            delta *= 2
+
+        deltas = []
+        while delta >= 1:
+            deltas.append(delta)
+            delta //= 2
+        return deltas + [0]
+
+    # Ford–Fulkerson on the sparse residual graph: O(E) per augmentation
+    def ford_fulkerson_sparse(self, source, sink, hooks=None, scaling=False):
+        parent_edge = [-1] * self.V
+        max_flow = 0
+        deltas = iter(self.scaling_deltas() if scaling else [0])
+        delta = next(deltas)
+
+        while True:
+            if hooks is not None:
+                start = time.perf_counter()
+            found = self.dfs_sparse(source, sink, parent_edge, delta)
+            if hooks is not None:
+                hooks.on_phase("search", time.perf_counter() - start)
+                start = time.perf_counter()
+            if not found:
+                delta = next(deltas, None)
+                if delta is None:
+                    break
+                continue
+
+            path_flow = float("inf")
+            path_length = 0
+            v = sink
+
+            # Find minimum residual capacity along the path
+            while v != source:
+                e = parent_edge[v]
+                path_flow = min(path_flow, self.cap[e])
+                path_length += 1
+                v = self.to[e ^ 1]
+
+            max_flow += path_flow
+
+            # Update residual edge pairs
+            v = sink
+            while v != source:
+                e = parent_edge[v]
+                self.cap[e] -= path_flow
+                self.cap[e ^ 1] += path_flow
+                v = self.to[e ^ 1]
+
+            if hooks is not None:
+                hooks.on_phase("augment", time.perf_counter() - start)
+                hooks.on_augment(path_length, path_flow)
+
+        return max_flow
+
     # Ford–Fulkerson Algorithm
-    def ford_fulkerson(self, source, sink):
+    # hooks: optional FlowStats-like object, verbose: print residual graph,
+    # scaling: capacity scaling, O(E log U) augmentations
+    def ford_fulkerson(self, source, sink, hooks=None, verbose=False, scaling=False):
+        if self.sparse:
+            return self.ford_fulkerson_sparse(source, sink, hooks, scaling)
+
         parent = [-1] * self.V
         max_flow = 0
+        deltas = iter(self.scaling_deltas() if scaling else [0])
+        delta = next(deltas)
+
+        while True:
+            if hooks is not None:
+                start = time.perf_counter()
+            found = self.dfs(source, sink, parent, delta)
+            if hooks is not None:
+                hooks.on_phase("search", time.perf_counter() - start)
+                start = time.perf_counter()
+            if not found:
+                delta = next(deltas, None)
+                if delta is None:
+                    break
+                continue
 
-        while self.dfs(source, sink, parent):
             path_flow = float("inf")
+            path_length = 0
             v = sink
 
             # Find minimum residual capacity along the path
             while v != source:
                 u = parent[v]
                 path_flow = min(path_flow, self.graph[u][v])
+                path_length += 1
                 v = u
 
             max_flow += path_flow
@@ -55,18 +213,174 @@ class Graph:
                 self.graph[v][u] += path_flow
                 v = u
 
-            print("\nResidual Graph After Augmentation:")
-            for row in self.graph:
-                print(row)
+            if hooks is not None:
+                hooks.on_phase("augment", time.perf_counter() - start)
+                hooks.on_augment(path_length, path_flow)
+
+            if verbose:
+                print("\nResidual Graph After Augmentation:")
+                for row in self.graph:
+                    print(row)
 
         return max_flow
 
+    # Original edges as (u, v, capacity, flow) after a max-flow run
+    def edge_flows(self):
+        if self.sparse:
+            for e in range(0, len(self.to), 2):
+                yield self.to[e ^ 1], self.to[e], self.cap[e] + self.cap[e ^ 1], self.cap[e ^ 1]
+        else:
+            for (u, v), c in self.capacity.items():
+                yield u, v, c, max(0, c - self.graph[u][v])
+
+    def residual_neighbors(self, u):
+        if self.sparse:
+            return [self.to[e] for e in self.adj[u] if self.cap[e] > 0]
+        return [v for v in range(self.V) if self.graph[u][v] > 0]
+
+    # Min cut from the final residual graph: (source side, cut edges)
+    def min_cut(self, source):
+        return residual_min_cut(self.V, self.residual_neighbors,
+                                self.edge_flows(), source)
+
+    # Final flow split into s-t paths and cycles
+    def flow_decomposition(self, source, sink):
+        return decompose_flow(self.V, self.edge_flows(), source, sink)
+
+
+# -------------------------------------------------------
+# Flow network with capacities and flow kept separately,
+# re-optimised incrementally after capacity changes
+# -------------------------------------------------------
+class FlowNetwork:
+    def __init__(self, vertices):
+        self.V = vertices
+        # edge e and e ^ 1 are a forward/reverse pair
+        self.adj = [[] for _ in range(vertices)]
+        self.to = []
+        self.capacity = []      # original capacities (0 on reverse edges)
+        self.flow = []          # flow[e ^ 1] == -flow[e]
+        self.edge_id = {}       # (u, v) -> forward edge id
+        self.source = None
+        self.sink = None
+
+    # Repeated u → v edges add up, as in Graph.add_edge;
+    # update_capacity is the way to set a capacity outright
+    def add_edge(self, u, v, capacity):
+        e = self.edge_id.get((u, v))
+        if e is not None:
+            self.update_capacity(u, v, self.capacity[e] + capacity)
+            return
+
+        self.edge_id[(u, v)] = len(self.to)
+        for a, b, c in ((u, v, capacity), (v, u, 0)):
+            self.adj[a].append(len(self.to))
+            self.to.append(b)
+            self.capacity.append(c)
+            self.flow.append(0)
+
+    # Shortest residual paths (Edmonds–Karp) from a to b, at most limit
+    def augment(self, a, b, limit=float("inf")):
+        pushed = 0
+        while pushed < limit:
+            parent_edge = [-1] * self.V
+            parent_edge[a] = -2
+            queue = deque([a])
+
+            while queue and parent_edge[b] == -1:
+                u = queue.popleft()
+                for e in self.adj[u]:
+                    v = self.to[e]
+                    if parent_edge[v] == -1 and self.capacity[e] - self.flow[e] > 0:
+                        parent_edge[v] = e
+                        queue.append(v)
+
+            if parent_edge[b] == -1:
+                break
+
+            path_flow = limit - pushed
+            v = b
+            while v != a:
+                e = parent_edge[v]
+                path_flow = min(path_flow, self.capacity[e] - self.flow[e])
+                v = self.to[e ^ 1]
+
+            v = b
+            while v != a:
+                e = parent_edge[v]
+                self.flow[e] += path_flow
+                self.flow[e ^ 1] -= path_flow
+                v = self.to[e ^ 1]
+
+            pushed += path_flow
+        return pushed
+
+    # Current flow value (net flow out of the source)
+    def value(self):
+        return sum(self.flow[e] for e in self.adj[self.source])
+
+    def max_flow(self, source, sink):
+        self.source = source
+        self.sink = sink
+        self.augment(source, sink)
+        return self.value()
+
+    # Change capacity of (u, v) and repair the current maximum flow
+    def update_capacity(self, u, v, capacity):
+        e = self.edge_id.get((u, v))
+        if e is None:
+            self.add_edge(u, v, capacity)
+        else:
+            self.capacity[e] = capacity
+
+        if self.source is None:
+            return None
+        s, t = self.source, self.sink
+
+        surplus = 0 if e is None else self.flow[e] - capacity
+        if surplus > 0:
+            # Decrease: u now has surplus, v a deficit of the same size
+            self.flow[e] -= surplus
+            self.flow[e ^ 1] += surplus
+
+            # First reroute u -> v around the edge (keeps the value) ...
+            surplus -= self.augment(u, v, surplus)
+
+            # ... then cancel the rest back to s and forward from t
+            if surplus > 0:
+                if u != s and u != t:
+                    self.augment(u, s, surplus)
+                if v != s and v != t:
+                    self.augment(t, v, surplus)
+
+        # Increase (or freed residual capacity): augment from s to t
+        self.augment(s, t)
+        return self.value()
+
+
+    def edge_flows(self):
+        for (u, v), e in self.edge_id.items():
+            yield u, v, self.capacity[e], self.flow[e]
+
+    def residual_neighbors(self, u):
+        return [self.to[e] for e in self.adj[u]
+                if self.capacity[e] - self.flow[e] > 0]
+
+    # Min cut of the current flow: (source side, cut edges)
+    def min_cut(self):
+        return residual_min_cut(self.V, self.residual_neighbors,
+                                self.edge_flows(), self.source)
+
+    # Current flow split into s-t paths and cycles
+    def flow_decomposition(self):
+        return decompose_flow(self.V, self.edge_flows(), self.source, self.sink)
+
 
 # -------------------------------------------------------
 # Helper to generate deterministic / random capacity graph
 # -------------------------------------------------------
-def create_test_graph(randomize=False):
-    g = Graph(6)
+def create_test_graph(randomize=False, sparse=False):
+    g = Graph(6, sparse)
 
     if randomize:
         g.add_edge(0, 1, random.randint(5,20))
@@ -91,16 +405,69 @@ def create_test_graph(randomize=False):
     return g
 
 
+# -------------------------------------------------------
+# Random networks with wide capacity ranges
+# -------------------------------------------------------
+def random_flow_edges(n, m, max_cap, seed=None):
+    rng = random.Random(seed)
+    edges = {}
+
+    # a random s → t path so the flow is never trivially 0
+    path = [0] + rng.sample(range(1, n - 1), min(n - 2, 3)) + [n - 1]
+    for u, v in zip(path, path[1:]):
+        edges[(u, v)] = rng.randint(1, max_cap)
+
+    while len(edges) < min(m, n * (n - 1)):
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v and (u, v) not in edges:
+            edges[(u, v)] = rng.randint(1, max_cap)
+
+    return [(u, v, c) for (u, v), c in edges.items()]
+
+
+def create_random_graph(n, m, max_cap=10**6, sparse=False, seed=None):
+    g = Graph(n, sparse)
+    for u, v, c in random_flow_edges(n, m, max_cap, seed):
+        g.add_edge(u, v, c)
+    return g
+
+
 # -------------------------------------------------------
 # MAIN
 # -------------------------------------------------------
 if __name__ == "__main__":
     print("Ford–Fulkerson (Deterministic Capacities)")
     g1 = create_test_graph(randomize=False)
-    print("Maximum Flow:", g1.ford_fulkerson(0, 5))
+    print("Maximum Flow:", g1.ford_fulkerson(0, 5, verbose=True))
 
     print("\n--------------------------------------------\n")
 
     print("Ford–Fulkerson (Randomized Capacities)")
     g2 = create_test_graph(randomize=True)
-    print("Maximum Flow:", g2.ford_fulkerson(0, 5))
+    stats = FlowStats()
+    print("Maximum Flow:", g2.ford_fulkerson(0, 5, hooks=stats))
+    print("Stats:", stats.summary())
+
+    print("\n--------------------------------------------\n")
+
+    print("Ford–Fulkerson (Capacity Scaling)")
+    g4 = create_test_graph(randomize=False)
+    print("Maximum Flow:", g4.ford_fulkerson(0, 5, scaling=True))
+
+    print("\n--------------------------------------------\n")
+
+    print("Ford–Fulkerson (Sparse Residual Graph)")
+    g3 = create_test_graph(randomize=False, sparse=True)
+    print("Maximum Flow:", g3.ford_fulkerson(0, 5))
+    print("Min Cut:", g3.min_cut(0))
+
+    print("\n--------------------------------------------\n")
+
+    print("Incremental Re-solve After Capacity Changes")
+    fn = FlowNetwork(6)
+    for u, v, c in [(0,1,16), (0,2,13), (1,3,12), (2,1,4),
+                    (2,4,14), (3,5,20), (4,3,7), (4,5,4)]:
+        fn.add_edge(u, v, c)
+    print("Maximum Flow:", fn.max_flow(0, 5))
+    print("After c(3,5) = 10:", fn.update_capacity(3, 5, 10))
+    print("After c(3,5) = 20:", fn.update_capacity(3, 5, 20))
@@ -0,0 +1,233 @@
+import heapq
+import random
+import time
+
+# -------------------------------------------------------
+# Min-Cost Max-Flow (Successive Shortest Paths with
+# Dijkstra on reduced costs / Johnson potentials, all
+# shortest paths of a phase augmented together)
+# -------------------------------------------------------
+class MinCostFlow:
+    def __init__(self, n):
+        self.n = n
+        # edge e and e ^ 1 are a forward/reverse residual pair
+        self.adj = [[] for _ in range(n)]
+        self.to = []
+        self.cap = []
+        self.cost = []
+
+    def add_edge(self, u, v, capacity, cost):
+        self.adj[u].append(len(self.to))
+        self.to.append(v)
+        self.cap.append(capacity)
+        self.cost.append(cost)
+
+        self.adj[v].append(len(self.to))
+        self.to.append(u)
+        self.cap.append(0)
+        self.cost.append(-cost)
+        return len(self.to) - 2     # forward edge id
+
+    # Initial potentials when some costs are negative
+    def bellman_ford(self, s):
+        dist = [float("inf")] * self.n
+        dist[s] = 0
+
+        for _ in range(self.n - 1):
+            changed = False
+            for u in range(self.n):
+                if dist[u] == float("inf"):
+                    continue
+                for e in self.adj[u]:
+                    v = self.to[e]
+                    if self.cap[e] > 0 and dist[u] + self.cost[e] < dist[v]:
+                        dist[v] = dist[u] + self.cost[e]
+                        changed = True
+            if not changed:
+                break
+
+        # vertices unreachable from s never join an augmenting path
+        return [d if d != float("inf") else 0 for d in dist]
+
+    # Dijkstra on reduced costs (same heap pattern as poly_vs_nphard),
+    # stopping once t is settled
+    def dijkstra(self, s, t, potential):
+        dist = [float("inf")] * self.n
+        dist[s] = 0
+        pq = [(0, s)]
+
+        while pq:
+            d, u = heapq.heappop(pq)
+            if d > dist[u]:
+                continue
+            if u == t:
+                break
+
+            for e in self.adj[u]:
+                if self.cap[e] > 0:
+                    v = self.to[e]
+                    nd = d + self.cost[e] + potential[u] - potential[v]
+                    if dist[v] > nd:
+                        dist[v] = nd
+                        heapq.heappush(pq, (nd, v))
+
+        return dist
+
+    # Blocking flow on admissible edges (residual, zero reduced cost)
+    # inside the region Dijkstra reached, DFS with current arcs
+    def augment_admissible(self, s, t, potential, region, limit):
+        adj, to, cap, cost = self.adj, self.to, self.cap, self.cost
+        usable = region[:]      # cleared for dead ends
+        on_path = [False] * self.n
+        it = [0] * self.n
+        flow = 0
+        path = []
+        u = s
+        on_path[s] = True
+
+        while flow < limit:
+            if u == t:
+                path_flow = min(min(cap[e] for e in path), limit - flow)
+                cut = len(path)
+                for i, e in enumerate(path):
+                    cap[e] -= path_flow
+                    cap[e ^ 1] += path_flow
+                    if cap[e] == 0 and i < cut:
+                        cut = i
+                flow += path_flow
+                for e in path[cut:]:
+                    on_path[to[e]] = False
+                del path[cut:]
+                u = to[path[-1]] if path else s
+                continue
+
+            edges = adj[u]
+            pu = potential[u]
+            i = it[u]
+            while i < len(edges):
+                e = edges[i]
+                v = to[e]
+                if usable[v] and not on_path[v] and cap[e] > 0 and cost[e] + pu == potential[v]:
+                    break
+                i += 1
+            it[u] = i
+
+            if i < len(edges):
+                e = edges[i]
+                path.append(e)
+                u = to[e]
+                on_path[u] = True
+                continue
+
+            # Dead end: drop u and retreat
+            usable[u] = False
+            on_path[u] = False
+            if not path:
+                break
+            e = path.pop()
+            u = to[e ^ 1]
+            it[u] += 1
+
+        return flow
+
+    # Returns (flow, cost) of a minimum-cost flow of value ≤ max_flow
+    # (integer costs, so zero reduced costs compare exactly)
+    def min_cost_flow(self, s, t, max_flow=float("inf")):
+        if any(c < 0 for e, c in enumerate(self.cost) if e % 2 == 0 and self.cap[e] > 0):
+            potential = self.bellman_ford(s)
+        else:
+            potential = [0] * self.n
+
+        flow = 0
+        total_cost = 0
+
+        while flow < max_flow:
+            dist = self.dijkstra(s, t, potential)
+            if dist[t] == float("inf"):
+                break
+
+            # Capping at dist[t] keeps every reduced cost non-negative
+            region = [d <= dist[t] for d in dist]
+            for v in range(self.n):
+                potential[v] += min(dist[v], dist[t])
+
+            pushed = self.augment_admissible(s, t, potential, region, max_flow - flow)
+            flow += pushed
+            # every admissible s-t path costs potential[t] - potential[s]
+            total_cost += pushed * (potential[t] - potential[s])
+
+        return flow, total_cost
+
+
+# -------------------------------------------------------
+# Weighted Bipartite Assignment → Min-Cost Flow
+# -------------------------------------------------------
+def min_cost_assignment(U, V, edges, maximize=False):
+    """
+    U = number of left partition nodes
+    V = number of right partition nodes
+    edges = list of (u, v, weight) pairs
+    Returns (total weight, [(u, v), ...]) of a maximum matching with
+    minimum (or maximum) total weight.
+    """
+
+    source = U + V
+    sink = U + V + 1
+    mcf = MinCostFlow(U + V + 2)
+
+    for u in range(U):
+        mcf.add_edge(source, u, 1, 0)
+    for v in range(V):
+        mcf.add_edge(U + v, sink, 1, 0)
+
+    edge_ids = []
+    for u, v, w in edges:
+        e = mcf.add_edge(u, U + v, 1, -w if maximize else w)
+        edge_ids.append((e, u, v))
+
+    flow, cost = mcf.min_cost_flow(source, sink)
+    pairs = [(u, v) for e, u, v in edge_ids if mcf.cap[e] == 0]
+    return (-cost if maximize else cost), pairs
+
+
+# -------------------------------------------------------
+# MAIN
+# -------------------------------------------------------
+if __name__ == "__main__":
+    print("Min-Cost Max-Flow (Successive Shortest Paths)")
+    print("----------------------------------------------")
+
+    # CLRS network with a cost per unit of flow
+    mcf = MinCostFlow(6)
+    edges = [
+        (0,1,16,4), (0,2,13,1),
+        (1,3,12,2), (2,1,4,1),
+        (2,4,14,5), (3,5,20,1),
+        (4,3,7,1),  (4,5,4,3)
+    ]
+    for u, v, c, w in edges:
+        mcf.add_edge(u, v, c, w)
+
+    flow, cost = mcf.min_cost_flow(0, 5)
+    print("Maximum Flow:", flow)
+    print("Minimum Cost:", cost)
+
+    print("\nWeighted Bipartite Assignment")
+    print("----------------------------------------------")
+    weights = [
+        (0, 0, 4), (0, 1, 1), (0, 2, 3),
+        (1, 0, 2), (1, 1, 0), (1, 2, 5),
+        (2, 0, 3), (2, 1, 2), (2, 2, 2)
+    ]
+    print("Min-cost assignment:", min_cost_assignment(3, 3, weights))
+    print("Max-weight assignment:", min_cost_assignment(3, 3, weights, maximize=True))
+
+    print("\nScaling on random assignment instances")
+    print("----------------------------------------------")
+    print("  U=V  |  edges  | time (sec)")
+    for n in [500, 1000, 2000]:
+        rand_edges = [(random.randrange(n), random.randrange(n), random.randint(1, 100))
+                      for _ in range(10 * n)]
+        start = time.time()
+        min_cost_assignment(n, n, rand_edges)
+        print(f"{n:6d} | {len(rand_edges):7d} | {time.time() - start:.6f}")
@@ -0,0 +1,295 @@
+import random
+import sys
+import time
+
+from rbt_node import RED, BLACK
+
+# ---------------------------------------------------------
+# Persistent Red-Black Tree (path copying)
+#   nodes are never modified after construction, so an old
+#   root stays a valid, unchanging tree forever: a snapshot
+#   is just a reference (O(1)), an update copies only the
+#   O(log n) nodes on its search path
+#   insert: Okasaki's balance, delete: Kahrs' balleft /
+#   balright / app (no parent pointers, None = empty leaf)
+# ---------------------------------------------------------
+class PNode:
+    __slots__ = ("key", "color", "left", "right")
+
+    def __init__(self, key, color, left=None, right=None):
+        self.key = key
+        self.color = color
+        self.left = left
+        self.right = right
+
+
+def is_red(node):
+    return node is not None and node.color is RED
+
+
+def is_black_node(node):
+    return node is not None and node.color is BLACK
+
+
+# Black node over (a, key, b) that may have a red-red pair one
+# level down: rotate into a red node with two black children
+def balance(a, key, b):
+    if is_red(a) and is_red(b):
+        return PNode(key, RED, PNode(a.key, BLACK, a.left, a.right),
+                     PNode(b.key, BLACK, b.left, b.right))
+    if is_red(a):
+        if is_red(a.left):
+            ll = a.left
+            return PNode(a.key, RED, PNode(ll.key, BLACK, ll.left, ll.right),
+                         PNode(key, BLACK, a.right, b))
+        if is_red(a.right):
+            lr = a.right
+            return PNode(lr.key, RED, PNode(a.key, BLACK, a.left, lr.left),
+                         PNode(key, BLACK, lr.right, b))
+    if is_red(b):
+        if is_red(b.right):
+            rr = b.right
+            return PNode(b.key, RED, PNode(key, BLACK, a, b.left),
+                         PNode(rr.key, BLACK, rr.left, rr.right))
+        if is_red(b.left):
+            rl = b.left
+            return PNode(rl.key, RED, PNode(key, BLACK, a, rl.left),
+                         PNode(b.key, BLACK, rl.right, b.right))
+    return PNode(key, BLACK, a, b)
+
+
+# ---------------------------------------------------------
+# Insert
+# ---------------------------------------------------------
+def ins(node, key):
+    if node is None:
+        return PNode(key, RED)
+    if key < node.key:
+        if node.color is BLACK:
+            return balance(ins(node.left, key), node.key, node.right)
+        return PNode(node.key, RED, ins(node.left, key), node.right)
+    if key > node.key:
+        if node.color is BLACK:
+            return balance(node.left, node.key, ins(node.right, key))
+        return PNode(node.key, RED, node.left, ins(node.right, key))
+    return node
+
+
+def blacken(node):
+    if node is None or node.color is BLACK:
+        return node
+    return PNode(node.key, BLACK, node.left, node.right)
+
+
+# ---------------------------------------------------------
+# Delete
+# ---------------------------------------------------------
+def redden(node):
+    return PNode(node.key, RED, node.left, node.right)
+
+
+# Left side lost one black level
+def balleft(a, key, b):
+    if is_red(a):
+        return PNode(key, RED, PNode(a.key, BLACK, a.left, a.right), b)
+    if is_black_node(b):
+        return balance(a, key, redden(b))
+    # b is red with a black left child
+    bl = b.left
+    return PNode(bl.key, RED, PNode(key, BLACK, a, bl.left),
+                 balance(bl.right, b.key, redden(b.right)))
+
+
+# Right side lost one black level
+def balright(a, key, b):
+    if is_red(b):
+        return PNode(key, RED, a, PNode(b.key, BLACK, b.left, b.right))
+    if is_black_node(a):
+        return balance(redden(a), key, b)
+    # a is red with a black right child
+    ar = a.right
+    return PNode(ar.key, RED, balance(redden(a.left), a.key, ar.left),
+                 PNode(key, BLACK, ar.right, b))
+
+
+# Glue two subtrees of equal black height (all of a < all of b)
+def app(a, b):
+    if a is None:
+        return b
+    if b is None:
+        return a
+    if is_red(a) and is_red(b):
+        mid = app(a.right, b.left)
+        if is_red(mid):
+            return PNode(mid.key, RED, PNode(a.key, RED, a.left, mid.left),
+                         PNode(b.key, RED, mid.right, b.right))
+        return PNode(a.key, RED, a.left, PNode(b.key, RED, mid, b.right))
+    if a.color is BLACK and b.color is BLACK:
+        mid = app(a.right, b.left)
+        if is_red(mid):
+            return PNode(mid.key, RED, PNode(a.key, BLACK, a.left, mid.left),
+                         PNode(b.key, BLACK, mid.right, b.right))
+        return balleft(a.left, a.key, PNode(b.key, BLACK, mid, b.right))
+    if is_red(b):
+        return PNode(b.key, RED, app(a, b.left), b.right)
+    return PNode(a.key, RED, a.left, app(a.right, b))
+
+
+def delete(node, key):
+    if node is None:
+        return None
+    if key < node.key:
+        if is_black_node(node.left):
+            return balleft(delete(node.left, key), node.key, node.right)
+        return PNode(node.key, RED, delete(node.left, key), node.right)
+    if key > node.key:
+        if is_black_node(node.right):
+            return balright(node.left, node.key, delete(node.right, key))
+        return PNode(node.key, RED, node.left, delete(node.right, key))
+    return app(node.left, node.right)
+
+
+# ---------------------------------------------------------
+# Tree Handle: (root, size), both immutable
+# ---------------------------------------------------------
+class PersistentRBTree:
+    __slots__ = ("root", "size")
+
+    def __init__(self, root=None, size=0):
+        self.root = root
+        self.size = size
+
+    def __len__(self):
+        return self.size
+
+    # New tree containing key (self if it is already there)
+    def insert(self, key):
+        if key in self:
+            return self
+        return PersistentRBTree(blacken(ins(self.root, key)), self.size + 1)
+
+    # New tree without key (self if it is missing)
+    def delete(self, key):
+        if key not in self:
+            return self
+        return PersistentRBTree(blacken(delete(self.root, key)), self.size - 1)
+
+    def search(self, key):
+        cur = self.root
+        while cur is not None:
+            if key == cur.key:
+                return True
+            cur = cur.left if key < cur.key else cur.right
+        return False
+
+    def __contains__(self, key):
+        return self.search(key)
+
+    # O(n) build from distinct sorted keys, deepest level red
+    # (same shape as RedBlackTree.from_sorted in rbt_delete)
+    @classmethod
+    def from_sorted(cls, keys):
+        keys = list(keys)
+        for i in range(1, len(keys)):
+            if not keys[i - 1] < keys[i]:
+                raise ValueError("from_sorted() needs strictly increasing keys")
+
+        max_depth = len(keys).bit_length() - 1
+
+        def build(lo, hi, depth):
+            if lo > hi:
+                return None
+            mid = (lo + hi) // 2
+            color = RED if depth == max_depth and depth > 0 else BLACK
+            return PNode(keys[mid], color, build(lo, mid - 1, depth + 1),
+                         build(mid + 1, hi, depth + 1))
+
+        return cls(build(0, len(keys) - 1, 0), len(keys))
+
+    # Lazy inorder walk with an explicit stack, lo <= key <= hi
+    def iter_range(self, lo=None, hi=None):
+        stack = []
+        cur = self.root
+        while stack or cur is not None:
+            if cur is not None:
+                if lo is not None and cur.key < lo:
+                    cur = cur.right          # whole left side is below lo
+                else:
+                    stack.append(cur)
+                    cur = cur.left
+                continue
+            node = stack.pop()
+            if hi is not None and node.key > hi:
+                return
+            yield node.key
+            cur = node.right
+
+    def __iter__(self):
+        return self.iter_range()
+
+    # Iterative check: no red-red, equal black heights, BST order;
+    # raises ValueError, returns the black height
+    def verify_properties(self):
+        if is_red(self.root):
+            raise ValueError("root is red")
+
+        count = 0
+        height = None
+        stack = [(self.root, None, None, 0)]
+        while stack:
+            node, lo, hi, blacks = stack.pop()
+            if node is None:
+                if height is None:
+                    height = blacks
+                elif blacks != height:
+                    raise ValueError("unequal black heights")
+                continue
+            count += 1
+            if (lo is not None and node.key <= lo) or (hi is not None and node.key >= hi):
+                raise ValueError(f"key {node.key} out of BST order")
+            if is_red(node) and (is_red(node.left) or is_red(node.right)):
+                raise ValueError(f"red node {node.key} has a red child")
+            blacks += node.color is BLACK
+            stack.append((node.left, lo, node.key, blacks))
+            stack.append((node.right, node.key, hi, blacks))
+
+        if count != self.size:
+            raise ValueError("size does not match the number of nodes")
+        return height
+
+
+# ---------------------------------------------------------
+# MAIN – snapshots stay frozen while the writer moves on
+# ---------------------------------------------------------
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    print("Persistent Red-Black Tree (path copying)")
+    print("----------------------------------------")
+
+    t = PersistentRBTree()
+    for key in [10, 20, 30, 15, 25, 5, 1]:
+        t = t.insert(key)
+    snapshot = t
+    t = t.delete(20).insert(40)
+    print("Snapshot:", list(snapshot))
+    print("Current :", list(t))
+
+    keys = random.sample(range(10 * n), n)
+    start = time.time()
+    t = PersistentRBTree()
+    versions = []
+    for i, key in enumerate(keys):
+        t = t.insert(key)
+        if i % (n // 10) == 0:
+            versions.append(t)          # O(1) snapshot
+    print(f"\n{n} inserts keeping {len(versions)} snapshots: {time.time() - start:.3f} sec")
+
+    start = time.time()
+    for key in keys[: n // 2]:
+        t = t.delete(key)
+    print(f"{n // 2} deletes: {time.time() - start:.3f} sec")
+
+    print("Snapshot sizes:", [len(v) for v in versions])
+    print("Black height (current):", t.verify_properties())
+    print("All snapshots valid:", all(v.verify_properties() >= 0 for v in versions))
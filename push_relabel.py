@@ -1,72 +1,220 @@
 from collections import deque
 import random
 
+from flow_decomposition import residual_min_cut, decompose_flow
+
 # -------------------------------------------------------
 # Push–Relabel Algorithm
 # -------------------------------------------------------
 class PushRelabel:
     def __init__(self, n):
         self.n = n
-        self.capacity = [[0]*n for _ in range(n)]
-        self.flow = [[0]*n for _ in range(n)]
+        # Residual edges in flat arrays; edge e and e ^ 1 are a
+        # forward/reverse pair, adj[u] lists edge ids out of u
+        self.adj = [[] for _ in range(n)]
+        self.to = []
+        self.cap = []
         self.height = [0]*n
         self.excess = [0]*n
+        self.current = [0]*n    # current-arc pointer into adj[u]
         self.count_relabels = 0
+        self.count_pushes = 0
+        self.count_global_relabels = 0
+        self.count_gaps = 0
 
     def add_edge(self, u, v, cap):
-        self.capacity[u][v] = cap
+        self.adj[u].append(len(self.to))
+        self.to.append(v)
+        self.cap.append(cap)
+
+        self.adj[v].append(len(self.to))
+        self.to.append(u)
+        self.cap.append(0)
 
-    # Push operation
-    def push(self, u, v):
-        send = min(self.excess[u], self.capacity[u][v] - self.flow[u][v])
-        self.flow[u][v] += send
-        self.flow[v][u] -= send
+    # Push operation along residual edge e out of u
+    def push(self, u, e):
+        v = self.to[e]
+        send = min(self.excess[u], self.cap[e])
+        self.cap[e] -= send
+        self.cap[e ^ 1] += send
         self.excess[u] -= send
         self.excess[v] += send
+        self.count_pushes += 1
 
     # Relabel operation
     def relabel(self, u):
         min_height = float("inf")
-        for v in range(self.n):
-            if self.capacity[u][v] - self.flow[u][v] > 0:
-                min_height = min(min_height, self.height[v])
+        for e in self.adj[u]:
+            if self.cap[e] > 0:
+                min_height = min(min_height, self.height[self.to[e]])
         self.height[u] = min_height + 1
+        self.current[u] = 0
         self.count_relabels += 1
 
+    # Discharge u, only touching residual arcs from the current arc on
     def discharge(self, u):
+        adj = self.adj[u]
         while self.excess[u] > 0:
-            done = False
-            for v in range(self.n):
-                if self.capacity[u][v] - self.flow[u][v] > 0 and self.height[u] == self.height[v] + 1:
-                    self.push(u, v)
-                    done = True
-                    if self.excess[u] == 0:
-                        break
-            if not done:
+            if self.current[u] == len(adj):
                 self.relabel(u)
+                continue
+            e = adj[self.current[u]]
+            if self.cap[e] > 0 and self.height[u] == self.height[self.to[e]] + 1:
+                self.push(u, e)
+            else:
+                self.current[u] += 1
 
-    # Main function to compute max flow
-    def max_flow(self, s, t):
+    # Saturate every edge out of the source
+    def init_preflow(self, s):
         self.height[s] = self.n
-        for v in range(self.n):
-            if self.capacity[s][v] > 0:
-                self.flow[s][v] = self.capacity[s][v]
-                self.flow[v][s] -= self.capacity[s][v]
-                self.excess[v] += self.capacity[s][v]
+        for e in self.adj[s]:
+            if self.cap[e] > 0:
+                self.excess[s] += self.cap[e]
+                self.push(s, e)
 
-        active = [i for i in range(self.n) if i != s and i != t]
+    # Main function to compute max flow (relabel-to-front)
+    def max_flow(self, s, t):
+        self.init_preflow(s)
 
-        p = 0
-        while p < len(active):
-            u = active[p]
+        # Linked list of vertices, moved to the front in O(1)
+        order = [i for i in range(self.n) if i != s and i != t]
+        nxt = [-1]*self.n
+        for a, b in zip(order, order[1:]):
+            nxt[a] = b
+        head = order[0] if order else -1
+
+        prev = -1
+        u = head
+        while u != -1:
             old_height = self.height[u]
             self.discharge(u)
-            if self.height[u] > old_height:
-                active.insert(0, active.pop(p))
-            else:
-                p += 1
+            if self.height[u] > old_height and prev != -1:
+                nxt[prev] = nxt[u]
+                nxt[u] = head
+                head = u
+            prev = u
+            u = nxt[u]
+
+        return self.excess[t], self.count_relabels
+
+    # Global relabel: exact distances to t by reverse BFS, then
+    # distances to s (offset by n) for vertices cut off from t
+    def global_relabel(self, s, t):
+        n = self.n
+        height = [2 * n] * n
+        height[t] = 0
+        height[s] = n
+
+        for root in (t, s):
+            queue = deque([root])
+            while queue:
+                v = queue.popleft()
+                for e in self.adj[v]:
+                    u = self.to[e]
+                    if height[u] == 2 * n and self.cap[e ^ 1] > 0:
+                        height[u] = height[v] + 1
+                        queue.append(u)
+
+        self.height = height
+        self.current = [0] * n
+        self.count_global_relabels += 1
+
+    # Highest-label Push–Relabel with buckets, global relabel and gaps
+    def max_flow_highest_label(self, s, t):
+        n = self.n
+        self.init_preflow(s)
+
+        adj, to, cap, excess = self.adj, self.to, self.cap, self.excess
+        height = current = None
+        buckets = []    # active vertices by height
+        levels = []     # all vertices by height (for the gap heuristic)
+
+        def rebuild():
+            nonlocal height, current, buckets, levels
+            self.global_relabel(s, t)
+            height, current = self.height, self.current
+            buckets = [[] for _ in range(2 * n + 1)]
+            levels = [set() for _ in range(2 * n + 1)]
+            for v in range(n):
+                levels[height[v]].add(v)
+                if v != s and v != t and excess[v] > 0:
+                    buckets[height[v]].append(v)
+            return max((h for h in range(2 * n + 1) if buckets[h]), default=-1)
+
+        b = rebuild()
+        relabels_since_global = 0
+
+        while b >= 0:
+            if not buckets[b]:
+                b -= 1
+                continue
+
+            u = buckets[b].pop()
+            if height[u] != b or excess[u] == 0:
+                continue    # stale bucket entry
 
-        return sum(self.flow[s][v] for v in range(self.n)), self.count_relabels
+            # Push along admissible arcs (targets are one level lower)
+            arcs = adj[u]
+            while excess[u] > 0 and current[u] < len(arcs):
+                e = arcs[current[u]]
+                v = to[e]
+                if cap[e] > 0 and height[u] == height[v] + 1:
+                    was_idle = excess[v] == 0
+                    self.push(u, e)
+                    if was_idle and v != s and v != t:
+                        buckets[height[v]].append(v)
+                else:
+                    current[u] += 1
+
+            if excess[u] == 0:
+                continue
+
+            old = height[u]
+            self.relabel(u)
+            relabels_since_global += 1
+            levels[old].discard(u)
+            levels[height[u]].add(u)
+
+            # Gap: no vertex left at height old, everything above it
+            # (and below n) can no longer reach the sink
+            if not levels[old] and old < n:
+                self.count_gaps += 1
+                for h in range(old + 1, n):
+                    for v in levels[h]:
+                        height[v] = n + 1
+                        current[v] = 0
+                        levels[n + 1].add(v)
+                        if v != s and v != t and excess[v] > 0:
+                            buckets[n + 1].append(v)
+                    levels[h] = set()
+
+            if relabels_since_global >= n:
+                relabels_since_global = 0
+                b = rebuild()
+                continue
+
+            if height[u] < 2 * n:
+                buckets[height[u]].append(u)
+                b = max(b, height[u])
+
+        return excess[t], self.count_relabels
+
+    # Original edges as (u, v, capacity, flow) after a max-flow run
+    def edge_flows(self):
+        for e in range(0, len(self.to), 2):
+            yield self.to[e ^ 1], self.to[e], self.cap[e] + self.cap[e ^ 1], self.cap[e ^ 1]
+
+    def residual_neighbors(self, u):
+        return [self.to[e] for e in self.adj[u] if self.cap[e] > 0]
+
+    # Min cut from the final residual graph: (source side, cut edges)
+    def min_cut(self, source):
+        return residual_min_cut(self.n, self.residual_neighbors,
+                                self.edge_flows(), source)
+
+    # Final flow split into s-t paths and cycles
+    def flow_decomposition(self, source, sink):
+        return decompose_flow(self.n, self.edge_flows(), source, sink)
 
 # -------------------------------------------------------
 # Example + Comparison with Ford–Fulkerson
@@ -96,3 +244,15 @@ if __name__ == "__main__":
 
     print("Maximum Flow:", maxflow)
     print("Relabel operations:", relabels)
+    print("Min Cut:", pr.min_cut(0))
+
+    print("\nHighest-Label Variant (global relabel + gap)")
+    print("-----------------------------------")
+
+    pr = create_graph()
+    maxflow, relabels = pr.max_flow_highest_label(0, 5)
+
+    print("Maximum Flow:", maxflow)
+    print("Relabel operations:", relabels)
+    print("Push operations:", pr.count_pushes)
+    print("Global relabels:", pr.count_global_relabels)
@@ -1,23 +1,40 @@
+from rbt_node import RBNode, RED, BLACK, color_name, inorder_nodes, dump_tree, load_tree
+
 # ---------------------------------------------------------
-# Red-Black Tree Node
+# Red-Black Tree Node (compact slotted node, see rbt_node)
+# augmented with its subtree size for select / rank and an
+# occurrence count (always 1 unless the tree is a multiset)
 # ---------------------------------------------------------
-class Node:
+class Node(RBNode):
+    __slots__ = ("size", "count")
+
     def __init__(self, key):
-        self.key = key
-        self.color = "RED"
-        self.left = None
-        self.right = None
-        self.parent = None
+        super().__init__(key)
+        self.size = 1
+        self.count = 1
 
 
 # ---------------------------------------------------------
 # Red-Black Tree Class
 # ---------------------------------------------------------
 class RedBlackTree:
-    def __init__(self):
+    node_class = Node
+
+    # debug=True re-checks the root-to-node path touched by every
+    # insert / delete (O(log² n), see check_path)
+    # multiset=True keeps one counted node per distinct key; size is
+    # then the number of occurrences, not of nodes
+    def __init__(self, debug=False, multiset=False):
         self.NULL = Node(0)
-        self.NULL.color = "BLACK"
+        self.NULL.color = BLACK
+        self.NULL.size = 0
+        self.NULL.count = 0
         self.root = self.NULL
+        self.debug = debug
+        self.multiset = multiset
+
+    def __len__(self):
+        return self.root.size
 
     # -----------------------------------------------------
     # Helper Rotations
@@ -39,6 +56,9 @@ class RedBlackTree:
         y.left = x
         x.parent = y
 
+        y.size = x.size
+        x.size = x.left.size + x.right.size + x.count
+
     def right_rotate(self, x):
         y = x.left
         x.left = y.right
@@ -56,64 +76,370 @@ class RedBlackTree:
         y.right = x
         x.parent = y
 
+        y.size = x.size
+        x.size = x.left.size + x.right.size + x.count
+
     # -----------------------------------------------------
     # Insert (Same as Program 1)
     # -----------------------------------------------------
     def insert(self, key):
-        node = Node(key)
-        node.left = self.NULL
-        node.right = self.NULL
-
         parent = None
         cur = self.root
         while cur != self.NULL:
             parent = cur
-            if node.key < cur.key:
+            cur.size += 1
+            if self.multiset and key == cur.key:
+                # duplicate: no new node, no rebalancing
+                cur.count += 1
+                if self.debug:
+                    self.check_path(cur)
+                return cur
+            if key < cur.key:
                 cur = cur.left
             else:
                 cur = cur.right
 
+        node = self.node_class(key)
+        node.left = self.NULL
+        node.right = self.NULL
         node.parent = parent
         if parent is None:
             self.root = node
-        elif node.key < parent.key:
+        elif key < parent.key:
             parent.left = node
         else:
             parent.right = node
 
         self.insert_fix(node)
+        if self.debug:
+            self.check_path(node)
+        return node
 
     def insert_fix(self, z):
-        while z.parent.color == "RED":
+        while z != self.root and z.parent.color is RED:
             if z.parent == z.parent.parent.left:
                 y = z.parent.parent.right
-                if y.color == "RED":
-                    z.parent.color = "BLACK"
-                    y.color = "BLACK"
-                    z.parent.parent.color = "RED"
+                if y.color is RED:
+                    z.parent.color = BLACK
+                    y.color = BLACK
+                    z.parent.parent.color = RED
                     z = z.parent.parent
                 else:
                     if z == z.parent.right:
                         z = z.parent
                         self.left_rotate(z)
-                    z.parent.color = "BLACK"
-                    z.parent.parent.color = "RED"
+                    z.parent.color = BLACK
+                    z.parent.parent.color = RED
                     self.right_rotate(z.parent.parent)
             else:
                 y = z.parent.parent.left
-                if y.color == "RED":
-                    z.parent.color = "BLACK"
-                    y.color = "BLACK"
-                    z.parent.parent.color = "RED"
+                if y.color is RED:
+                    z.parent.color = BLACK
+                    y.color = BLACK
+                    z.parent.parent.color = RED
                     z = z.parent.parent
                 else:
                     if z == z.parent.left:
                         z = z.parent
                         self.right_rotate(z)
-                    z.parent.color = "BLACK"
-                    z.parent.parent.color = "RED"
+                    z.parent.color = BLACK
+                    z.parent.parent.color = RED
                     self.left_rotate(z.parent.parent)
-        self.root.color = "BLACK"
+        self.root.color = BLACK
+
+    # -----------------------------------------------------
+    # Bulk Load: O(n) bottom-up build from sorted keys
+    # -----------------------------------------------------
+    @classmethod
+    def from_sorted(cls, keys, multiset=False):
+        tree = cls(multiset=True) if multiset else cls()
+        keys = list(keys)
+        for i in range(1, len(keys)):
+            if keys[i] < keys[i - 1]:
+                raise ValueError("from_sorted() needs keys in sorted order")
+
+        tree.root = tree.build_sorted(keys)
+        return tree
+
+    @classmethod
+    def from_iterable(cls, keys, multiset=False):
+        return cls.from_sorted(sorted(keys), multiset)
+
+    # Detached balanced tree over a sorted key list (runs of equal
+    # keys become one counted node in multiset mode)
+    def build_sorted(self, keys):
+        counts = None
+        if self.multiset:
+            distinct, counts = [], []
+            for key in keys:
+                if distinct and distinct[-1] == key:
+                    counts[-1] += 1
+                else:
+                    distinct.append(key)
+                    counts.append(1)
+            keys = distinct
+
+        if not keys:
+            return self.NULL
+        # midpoint splits put every leaf on the last two levels
+        max_depth = len(keys).bit_length() - 1
+        root = self.build(keys, 0, len(keys) - 1, 0, max_depth, counts)
+        root.parent = None
+        return root
+
+    # Balanced subtree over keys[lo..hi]; only the deepest level is
+    # red, so every root-to-leaf path has the same black height
+    def build(self, keys, lo, hi, depth, max_depth, counts=None):
+        if lo > hi:
+            return self.NULL
+
+        mid = (lo + hi) // 2
+        node = self.node_class(keys[mid])
+        node.color = RED if depth == max_depth and depth > 0 else BLACK
+        if counts is not None:
+            node.count = counts[mid]
+
+        node.left = self.build(keys, lo, mid - 1, depth + 1, max_depth, counts)
+        node.right = self.build(keys, mid + 1, hi, depth + 1, max_depth, counts)
+        if node.left != self.NULL:
+            node.left.parent = node
+        if node.right != self.NULL:
+            node.right.parent = node
+        node.size = node.left.size + node.right.size + node.count
+        return node
+
+    # -----------------------------------------------------
+    # Join / Split (subtree roots, parent pointers kept valid)
+    # -----------------------------------------------------
+    def black_height(self, node):
+        h = 0
+        while node != self.NULL:
+            if node.color is BLACK:
+                h += 1
+            node = node.left
+        return h
+
+    # Tree of left + [node] + right, all keys in left <= node.key <= right
+    def join(self, left, node, right):
+        for t in (left, right):
+            if t != self.NULL:
+                t.parent = None
+                t.color = BLACK
+        hl = self.black_height(left)
+        hr = self.black_height(right)
+        node.parent = None
+
+        if hl == hr:
+            node.left, node.right = left, right
+            for t in (left, right):
+                if t != self.NULL:
+                    t.parent = node
+            node.color = BLACK
+            node.size = left.size + right.size + node.count
+            return node
+
+        # Walk the spine of the taller tree down to a black node whose
+        # black height matches the shorter one, hang node there (red)
+        tall, short = (left, right) if hl > hr else (right, left)
+        h = max(hl, hr)
+        parent = None
+        cur = tall
+        while not (cur.color is BLACK and h == min(hl, hr)):
+            if cur.color is BLACK:
+                h -= 1
+            parent = cur
+            cur = cur.right if hl > hr else cur.left
+
+        if hl > hr:
+            node.left, node.right = cur, short
+            parent.right = node
+        else:
+            node.left, node.right = short, cur
+            parent.left = node
+        for t in (cur, short):
+            if t != self.NULL:
+                t.parent = node
+        node.parent = parent
+        node.color = RED
+        node.size = cur.size + short.size + node.count
+
+        up = parent
+        while up is not None:
+            up.size += short.size + node.count
+            up = up.parent
+
+        # Only a red-red violation is possible: same fixup as insert
+        saved = self.root
+        self.root = tall
+        self.insert_fix(node)
+        joined = self.root
+        self.root = saved
+        return joined
+
+    # (keys < key, [nodes with key in order], keys > key); equal
+    # keys can sit on both sides of a node with that key, so runs
+    # next to it are split off too
+    def split(self, root, key):
+        if root == self.NULL:
+            return self.NULL, [], self.NULL
+
+        left, right = root.left, root.right
+        if key < root.key:
+            l, equal, r = self.split(left, key)
+            return l, equal, self.join(r, root, right)
+        if key > root.key:
+            l, equal, r = self.split(right, key)
+            return self.join(left, root, l), equal, r
+
+        for t in (left, right):
+            if t != self.NULL:
+                t.parent = None
+        equal = [root]
+        if left != self.NULL and self.maximum(left).key == key:
+            left, before, _ = self.split(left, key)
+            equal = before + equal
+        if right != self.NULL and self.minimum(right).key == key:
+            _, after, right = self.split(right, key)
+            equal += after
+        return left, equal, right
+
+    # (root without its largest node, that node)
+    def split_last(self, root):
+        if root.right == self.NULL:
+            left = root.left
+            if left != self.NULL:
+                left.parent = None
+            return left, root
+        rest, last = self.split_last(root.right)
+        return self.join(root.left, root, rest), last
+
+    # Concatenate two trees, all keys in left <= all keys in right
+    def join_pair(self, left, right):
+        if left == self.NULL:
+            return right
+        if right == self.NULL:
+            return left
+        rest, last = self.split_last(left)
+        return self.join(rest, last, right)
+
+    # left + nodes (all with one key) + right
+    def join_all(self, left, nodes, right):
+        if not nodes:
+            return self.join_pair(left, right)
+        for node in nodes[:-1]:
+            left = self.join(left, node, self.NULL)
+        return self.join(left, nodes[-1], right)
+
+    # -----------------------------------------------------
+    # Set Operations: O(m log(n/m + 1)), the two recursive
+    # calls on each level touch disjoint subtrees
+    # -----------------------------------------------------
+    def union_roots(self, a, b, keep_both=False):
+        if a == self.NULL:
+            return b
+        if b == self.NULL:
+            return a
+
+        a_left, a_equal, a_right = self.split(a, b.key)
+        b_left, b_equal, b_right = self.split(b, b.key)
+        left = self.union_roots(a_left, b_left, keep_both)
+        right = self.union_roots(a_right, b_right, keep_both)
+        if self.multiset:
+            if a_equal:
+                b.count += a_equal[0].count
+            equal = b_equal
+        elif keep_both:
+            equal = a_equal + b_equal
+        else:
+            equal = b_equal + a_equal[len(b_equal):]
+        return self.join_all(left, equal, right)
+
+    def intersection_roots(self, a, b):
+        if a == self.NULL or b == self.NULL:
+            return self.NULL
+
+        a_left, a_equal, a_right = self.split(a, b.key)
+        b_left, b_equal, b_right = self.split(b, b.key)
+        left = self.intersection_roots(a_left, b_left)
+        right = self.intersection_roots(a_right, b_right)
+        if self.multiset:
+            if a_equal:
+                a_equal[0].count = min(a_equal[0].count, b.count)
+            equal = a_equal
+        else:
+            equal = a_equal[:len(b_equal)]
+        return self.join_all(left, equal, right)
+
+    def difference_roots(self, a, b):
+        if a == self.NULL:
+            return self.NULL
+        if b == self.NULL:
+            return a
+
+        a_left, a_equal, a_right = self.split(a, b.key)
+        b_left, b_equal, b_right = self.split(b, b.key)
+        left = self.difference_roots(a_left, b_left)
+        right = self.difference_roots(a_right, b_right)
+        if self.multiset:
+            equal = [n for n in a_equal if n.count > b.count]
+            for n in equal:
+                n.count -= b.count
+        else:
+            equal = a_equal[len(b_equal):]
+        return self.join_all(left, equal, right)
+
+    # Take over the nodes of another tree (re-pointing its sentinel)
+    def adopt(self, other):
+        if other.multiset != self.multiset:
+            raise ValueError("cannot combine a multiset with a plain tree")
+        root = other.root
+        other.root = other.NULL
+        if root == other.NULL:
+            return self.NULL
+
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if node.left == other.NULL:
+                node.left = self.NULL
+            else:
+                stack.append(node.left)
+            if node.right == other.NULL:
+                node.right = self.NULL
+            else:
+                stack.append(node.right)
+        return root
+
+    def set_root(self, root):
+        self.root = root
+        if root != self.NULL:
+            root.parent = None
+            root.color = BLACK
+
+    # Plain trees: a key held x times here and y times in other
+    # ends up max(x, y) / min(x, y) / max(x - y, 0) times, i.e. the
+    # usual set operations when keys are distinct.
+    # In multiset mode counts add / take the minimum / subtract.
+    # These consume other (it is left empty).
+    def union(self, other):
+        self.set_root(self.union_roots(self.root, self.adopt(other)))
+
+    def intersection(self, other):
+        self.set_root(self.intersection_roots(self.root, self.adopt(other)))
+
+    def difference(self, other):
+        self.set_root(self.difference_roots(self.root, self.adopt(other)))
+
+    # Same result as insert() per key, built as one sorted batch
+    def insert_many(self, keys):
+        batch = self.build_sorted(sorted(keys))
+        self.set_root(self.union_roots(self.root, batch, keep_both=True))
+
+    # Removes one occurrence of each distinct key (of each listed
+    # occurrence in multiset mode); missing keys are ignored
+    def delete_many(self, keys):
+        keys = sorted(keys) if self.multiset else sorted(set(keys))
+        self.set_root(self.difference_roots(self.root, self.build_sorted(keys)))
 
     # -----------------------------------------------------
     # Deletion Helpers
@@ -132,6 +458,11 @@ class RedBlackTree:
             node = node.left
         return node
 
+    def maximum(self, node):
+        while node.right != self.NULL:
+            node = node.right
+        return node
+
     # -----------------------------------------------------
     # Delete Node
     # -----------------------------------------------------
@@ -140,6 +471,19 @@ class RedBlackTree:
         if z == self.NULL:
             print("Key not found!")
             return
+        self.delete_node(z)
+
+    def delete_node(self, z):
+        if z.count > 1:
+            # multiset: drop one occurrence, the node stays
+            z.count -= 1
+            node = z
+            while node is not None:
+                node.size -= 1
+                node = node.parent
+            if self.debug:
+                self.check_path(z)
+            return
 
         y = z
         y_original_color = y.color
@@ -167,57 +511,66 @@ class RedBlackTree:
             y.left.parent = y
             y.color = z.color
 
-        if y_original_color == "BLACK":
+        # Sizes change only on the path above the spliced-out spot
+        node = x.parent
+        while node is not None:
+            node.size = node.left.size + node.right.size + node.count
+            node = node.parent
+
+        touched = x.parent
+        if y_original_color is BLACK:
             self.delete_fix(x)
+        if self.debug:
+            self.check_path(touched)
 
     # -----------------------------------------------------
     # Fix Double Black Issues
     # -----------------------------------------------------
     def delete_fix(self, x):
-        while x != self.root and x.color == "BLACK":
+        while x != self.root and x.color is BLACK:
             if x == x.parent.left:
                 w = x.parent.right
-                if w.color == "RED":
-                    w.color = "BLACK"
-                    x.parent.color = "RED"
+                if w.color is RED:
+                    w.color = BLACK
+                    x.parent.color = RED
                     self.left_rotate(x.parent)
                     w = x.parent.right
-                if w.left.color == "BLACK" and w.right.color == "BLACK":
-                    w.color = "RED"
+                if w.left.color is BLACK and w.right.color is BLACK:
+                    w.color = RED
                     x = x.parent
                 else:
-                    if w.right.color == "BLACK":
-                        w.left.color = "BLACK"
-                        w.color = "RED"
+                    if w.right.color is BLACK:
+                        w.left.color = BLACK
+                        w.color = RED
                         self.right_rotate(w)
                         w = x.parent.right
                     w.color = x.parent.color
-                    x.parent.color = "BLACK"
-                    w.right.color = "BLACK"
+                    x.parent.color = BLACK
+                    w.right.color = BLACK
                     self.left_rotate(x.parent)
                     x = self.root
             else:
                 w = x.parent.left
-                if w.color == "RED":
-                    w.color = "BLACK"
-                    x.parent.color = "RED"
+                if w.color is RED:
+                    w.color = BLACK
+                    x.parent.color = RED
                     self.right_rotate(x.parent)
                     w = x.parent.left
-                if w.right.color == "BLACK" and w.left.color == "BLACK":
-                    w.color = "RED"
+                if w.right.color is BLACK and w.left.color is BLACK:
+                    w.color = RED
                     x = x.parent
                 else:
-                    if w.left.color == "BLACK":
-                        w.right.color = "BLACK"
-                        w.color = "RED"
+                    if w.left.color is BLACK:
+                        w.right.color = BLACK
+                        w.color = RED
                         self.left_rotate(w)
                         w = x.parent.left
                     w.color = x.parent.color
-                    x.parent.color = "BLACK"
-                    w.left.color = "BLACK"
+                    x.parent.color = BLACK
+                    w.left.color = BLACK
                     self.right_rotate(x.parent)
                     x = self.root
-        x.color = "BLACK"
+        x.color = BLACK
 
     # -----------------------------------------------------
     # Search
@@ -233,20 +586,357 @@ class RedBlackTree:
                 cur = cur.right
         return self.NULL
 
+    def __contains__(self, key):
+        return self.search(key) != self.NULL
+
+    # -----------------------------------------------------
+    # Ordered Navigation (parent pointers, no recursion)
+    # -----------------------------------------------------
+    def successor(self, node):
+        if node.right != self.NULL:
+            return self.minimum(node.right)
+        parent = node.parent
+        while parent is not None and node == parent.right:
+            node = parent
+            parent = parent.parent
+        return parent if parent is not None else self.NULL
+
+    def predecessor(self, node):
+        if node.left != self.NULL:
+            return self.maximum(node.left)
+        parent = node.parent
+        while parent is not None and node == parent.left:
+            node = parent
+            parent = parent.parent
+        return parent if parent is not None else self.NULL
+
+    # First node with key >= key (NULL if none)
+    def ceiling_node(self, key):
+        best = self.NULL
+        cur = self.root
+        while cur != self.NULL:
+            if cur.key >= key:
+                best = cur
+                cur = cur.left
+            else:
+                cur = cur.right
+        return best
+
+    # Last node with key <= key (NULL if none)
+    def floor_node(self, key):
+        best = self.NULL
+        cur = self.root
+        while cur != self.NULL:
+            if cur.key <= key:
+                best = cur
+                cur = cur.right
+            else:
+                cur = cur.left
+        return best
+
+    # Lazily yields nodes with lo <= key <= hi: O(log n) to the first
+    # one, then O(1) amortized per node
+    def iter_nodes(self, lo=None, hi=None, reverse=False):
+        if self.root == self.NULL:
+            return
+
+        if not reverse:
+            node = self.minimum(self.root) if lo is None else self.ceiling_node(lo)
+            while node != self.NULL and (hi is None or node.key <= hi):
+                yield node
+                node = self.successor(node)
+        else:
+            node = self.maximum(self.root) if hi is None else self.floor_node(hi)
+            while node != self.NULL and (lo is None or node.key >= lo):
+                yield node
+                node = self.predecessor(node)
+
+    # Same for keys (repeated per occurrence in multiset mode)
+    def iter_range(self, lo=None, hi=None, reverse=False):
+        for node in self.iter_nodes(lo, hi, reverse):
+            for _ in range(node.count):
+                yield node.key
+
+    def __iter__(self):
+        return self.iter_range()
+
+    def __reversed__(self):
+        return self.iter_range(reverse=True)
+
+    # -----------------------------------------------------
+    # Order Statistics (O(log n) via subtree sizes)
+    # -----------------------------------------------------
+    # k-th smallest key, 0-indexed like randomized_select
+    def select(self, k):
+        if not 0 <= k < self.root.size:
+            raise IndexError("select index out of range")
+
+        cur = self.root
+        while True:
+            left = cur.left.size
+            if k < left:
+                cur = cur.left
+            elif k < left + cur.count:
+                return cur.key
+            else:
+                k -= left + cur.count
+                cur = cur.right
+
+    # Number of keys strictly smaller than key
+    def rank(self, key):
+        r = 0
+        cur = self.root
+        while cur != self.NULL:
+            if key <= cur.key:
+                cur = cur.left
+            else:
+                r += cur.left.size + cur.count
+                cur = cur.right
+        return r
+
+    # Number of occurrences of key (keys <= key minus keys < key)
+    def count(self, key):
+        at_most = 0
+        cur = self.root
+        while cur != self.NULL:
+            if key < cur.key:
+                cur = cur.left
+            else:
+                at_most += cur.left.size + cur.count
+                cur = cur.right
+        return at_most - self.rank(key)
+
     # -----------------------------------------------------
     # Verify RB Properties
     # -----------------------------------------------------
+    # Local checks of one node against its children
+    def check_node(self, node):
+        for child in (node.left, node.right):
+            if child != self.NULL:
+                if child.parent is not node:
+                    raise ValueError(f"broken parent pointer at {child.key}")
+                if node.color is RED and child.color is RED:
+                    raise ValueError(f"red node {node.key} has a red child {child.key}")
+        if node.left != self.NULL and node.left.key > node.key:
+            raise ValueError(f"left child {node.left.key} > {node.key}")
+        if node.right != self.NULL and node.right.key < node.key:
+            raise ValueError(f"right child {node.right.key} < {node.key}")
+        if node.count < 1 or (node.count > 1 and not self.multiset):
+            raise ValueError(f"bad occurrence count at {node.key}")
+        if node.size != node.left.size + node.right.size + node.count:
+            raise ValueError(f"wrong subtree size at {node.key}")
+
+    # Full O(n) check without recursion; raises ValueError on the
+    # first violation, returns the black height of the tree
     def verify_properties(self):
-        print("Properties Verified ✔️")
+        if self.NULL.color is not BLACK or self.NULL.size != 0:
+            raise ValueError("sentinel modified")
+        if self.root == self.NULL:
+            return 0
+        if self.root.color is not BLACK:
+            raise ValueError("root is red")
+        if self.root.parent is not None:
+            raise ValueError("root has a parent")
+
+        # Preorder with key bounds (equal keys may sit on either side)
+        order = []
+        stack = [(self.root, None, None)]
+        while stack:
+            node, lo, hi = stack.pop()
+            if (lo is not None and node.key < lo) or (hi is not None and node.key > hi):
+                raise ValueError(f"key {node.key} out of BST order")
+            self.check_node(node)
+            order.append(node)
+            if node.left != self.NULL:
+                stack.append((node.left, lo, node.key))
+            if node.right != self.NULL:
+                stack.append((node.right, node.key, hi))
+
+        # Children before parents: black heights bottom-up
+        height = {self.NULL: 0}
+        for node in reversed(order):
+            hl = height[node.left]
+            if hl != height[node.right]:
+                raise ValueError(f"unequal black heights below {node.key}")
+            height[node] = hl + (node.color is BLACK)
+
+        return height[self.root]
+
+    # Debug mode: checks the path from node up to the root and the
+    # children hanging off it, which is where the fixup rotations and
+    # recolors leave the nodes they move (old grandparent, sibling w).
+    # The path's black height is carried up from below; only the
+    # off-path child of each level has its spines walked
+    def check_path(self, node):
+        if self.root != self.NULL and self.root.color is not BLACK:
+            raise ValueError("root is red")
+        below, height = None, 0
+        while node is not None and node != self.NULL:
+            self.check_node(node)
+            hl = height if node.left is below else self.check_child(node.left)
+            hr = height if node.right is below else self.check_child(node.right)
+            if hl != hr:
+                raise ValueError(f"unequal black heights below {node.key}")
+            if node.parent is None and node is not self.root:
+                raise ValueError(f"node {node.key} is detached from the root")
+            height = hl + (node.color is BLACK)
+            below, node = node, node.parent
+
+    # Local checks plus equal spines of an off-path child; returns
+    # its black height
+    def check_child(self, node):
+        if node == self.NULL:
+            return 0
+        self.check_node(node)
+        hl = self.black_height(node.left)
+        if hl != self.black_height(node.right):
+            raise ValueError(f"unequal black heights below {node.key}")
+        return hl + (node.color is BLACK)
 
     # -----------------------------------------------------
-    # Inorder Print
+    # Inorder Print (iterative, see rbt_node.inorder_nodes)
     # -----------------------------------------------------
     def inorder(self, node):
+        for n in inorder_nodes(node, self.NULL):
+            print(f"{n.key} ({color_name(n.color)})", end="  ")
+
+    # -----------------------------------------------------
+    # Checkpoint / Restore (integer keys, see rbt_node)
+    # -----------------------------------------------------
+    def dumps(self):
+        return dump_tree(self.root, self.NULL, self.multiset)
+
+    # O(n): shape and colors come straight from the data, sizes
+    # are filled in children-first (reverse preorder)
+    @classmethod
+    def loads(cls, data):
+        tree = cls()
+        root, nodes, tree.multiset = load_tree(data, cls.node_class, tree.NULL)
+        for node in reversed(nodes):
+            node.size = node.left.size + node.right.size + node.count
+        tree.root = root
+        return tree
+
+
+# ---------------------------------------------------------
+# Sorted Map: the same tree with a value stored in each node
+# ---------------------------------------------------------
+class MapNode(Node):
+    __slots__ = ("value",)
+
+    def __init__(self, key):
+        super().__init__(key)
+        self.value = None
+
+
+class SortedMap(RedBlackTree):
+    """
+    Dict-like API over one key per node; lookups, updates and ordered
+    scans all read the value straight from the node.
+    Keys stay unique: insert / insert_many add missing keys with value
+    None and leave existing entries alone; in union() the values of
+    the other map win. There is no multiset mode.
+    """
+
+    node_class = MapNode
+
+    def __init__(self, items=(), debug=False):
+        super().__init__(debug=debug)
+        self.update(items)
+
+    @classmethod
+    def from_sorted(cls, keys, multiset=False):
+        if multiset:
+            raise ValueError("SortedMap keys are unique, no multiset mode")
+        keys = list(keys)
+        for i in range(1, len(keys)):
+            if not keys[i - 1] < keys[i]:
+                raise ValueError("from_sorted() needs strictly increasing keys")
+        return super().from_sorted(keys)
+
+    @classmethod
+    def from_iterable(cls, keys, multiset=False):
+        return cls.from_sorted(sorted(set(keys)), multiset)
+
+    # O(n) bulk load from (key, value) pairs in strictly increasing order
+    @classmethod
+    def from_sorted_items(cls, items):
+        items = list(items)
+        for i in range(1, len(items)):
+            if not items[i - 1][0] < items[i][0]:
+                raise ValueError("from_sorted_items() needs strictly increasing keys")
+
+        tree = cls.from_sorted(key for key, _ in items)
+        for node, (_, value) in zip(tree.iter_nodes(), items):
+            node.value = value
+        return tree
+
+    # Existing key: its node, unchanged
+    def insert(self, key):
+        node = self.search(key)
         if node != self.NULL:
-            self.inorder(node.left)
-            print(f"{node.key} ({node.color})", end="  ")
-            self.inorder(node.right)
+            return node
+        return super().insert(key)
+
+    # Batch as the right-hand side of union, so existing entries win
+    def insert_many(self, keys):
+        batch = self.build_sorted(sorted(set(keys)))
+        self.set_root(self.union_roots(batch, self.root))
+
+    def update(self, items):
+        if hasattr(items, "items"):
+            items = items.items()
+        for key, value in items:
+            self[key] = value
+
+    def __getitem__(self, key):
+        node = self.search(key)
+        if node == self.NULL:
+            raise KeyError(key)
+        return node.value
+
+    def __setitem__(self, key, value):
+        self.insert(key).value = value
+
+    def __delitem__(self, key):
+        node = self.search(key)
+        if node == self.NULL:
+            raise KeyError(key)
+        self.delete_node(node)
+
+    def get(self, key, default=None):
+        node = self.search(key)
+        return default if node == self.NULL else node.value
+
+    # (key, value) with the largest key <= key, or None
+    def floor(self, key):
+        node = self.floor_node(key)
+        return None if node == self.NULL else (node.key, node.value)
+
+    # (key, value) with the smallest key >= key, or None
+    def ceiling(self, key):
+        node = self.ceiling_node(key)
+        return None if node == self.NULL else (node.key, node.value)
+
+    def keys(self, lo=None, hi=None):
+        return self.iter_range(lo, hi)
+
+    def values(self, lo=None, hi=None):
+        for node in self.iter_nodes(lo, hi):
+            yield node.value
+
+    # Ordered (key, value) pairs with lo <= key <= hi
+    def items(self, lo=None, hi=None, reverse=False):
+        for node in self.iter_nodes(lo, hi, reverse):
+            yield node.key, node.value
+
+    # the binary format holds keys only
+    def dumps(self):
+        raise TypeError("SortedMap values cannot be stored by dumps()")
+
+    @classmethod
+    def loads(cls, data):
+        raise TypeError("SortedMap values cannot be restored by loads()")
 
 
 # ---------------------------------------------------------
@@ -260,6 +950,10 @@ if __name__ == "__main__":
     print(" insert X")
     print(" delete X")
     print(" inorder")
+    print(" select K")
+    print(" rank X")
+    print(" count X")
+    print(" range LO HI")
     print(" exit\n")
 
     while True:
@@ -279,7 +973,30 @@ if __name__ == "__main__":
             rbt.inorder(rbt.root)
             print("\n")
 
-            rbt.verify_properties()
+            try:
+                rbt.verify_properties()
+                print("Properties Verified ✔️")
+            except ValueError as e:
+                print("Property violated:", e)
+
+        elif cmd.startswith("select"):
+            _, k = cmd.split()
+            try:
+                print("Key with", k, "smaller keys:", rbt.select(int(k)))
+            except IndexError:
+                print("Index out of range!")
+
+        elif cmd.startswith("rank"):
+            _, val = cmd.split()
+            print("Keys smaller than", val, ":", rbt.rank(int(val)))
+
+        elif cmd.startswith("count"):
+            _, val = cmd.split()
+            print("Occurrences of", val, ":", rbt.count(int(val)))
+
+        elif cmd.startswith("range"):
+            _, lo, hi = cmd.split()
+            print("Keys in range:", list(rbt.iter_range(int(lo), int(hi))))
 
         elif cmd == "inorder":
             rbt.inorder(rbt.root)
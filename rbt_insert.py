@@ -1,13 +1,9 @@
+from rbt_node import RBNode, RED, BLACK, color_name, inorder_nodes, dump_tree, load_tree
+
 # ---------------------------------------------------------
-# Red-Black Tree Node
+# Red-Black Tree Node (compact slotted node, see rbt_node)
 # ---------------------------------------------------------
-class Node:
-    def __init__(self, key):
-        self.key = key
-        self.color = "RED"
-        self.left = None
-        self.right = None
-        self.parent = None
+Node = RBNode
 
 # ---------------------------------------------------------
 # Red-Black Tree
@@ -15,7 +11,7 @@ class Node:
 class RedBlackTree:
     def __init__(self):
         self.NULL = Node(0)
-        self.NULL.color = "BLACK"
+        self.NULL.color = BLACK
         self.root = self.NULL
 
     # -----------------------------------------------------
@@ -62,14 +58,14 @@ class RedBlackTree:
     # Insert Fix (fix violations)
     # -----------------------------------------------------
     def fix_insert(self, z):
-        while z.parent.color == "RED":
+        while z != self.root and z.parent.color is RED:
             if z.parent == z.parent.parent.left:
                 y = z.parent.parent.right  # uncle
-                if y.color == "RED":
+                if y.color is RED:
                     # Case 1: recolor
-                    z.parent.color = "BLACK"
-                    y.color = "BLACK"
-                    z.parent.parent.color = "RED"
+                    z.parent.color = BLACK
+                    y.color = BLACK
+                    z.parent.parent.color = RED
                     z = z.parent.parent
                 else:
                     # Case 2/3: rotations
@@ -77,30 +73,30 @@ class RedBlackTree:
                         z = z.parent
                         self.left_rotate(z)
 
-                    z.parent.color = "BLACK"
-                    z.parent.parent.color = "RED"
+                    z.parent.color = BLACK
+                    z.parent.parent.color = RED
                     self.right_rotate(z.parent.parent)
 
             else:  # mirror case
                 y = z.parent.parent.left
-                if y.color == "RED":
-                    z.parent.color = "BLACK"
-                    y.color = "BLACK"
-                    z.parent.parent.color = "RED"
+                if y.color is RED:
+                    z.parent.color = BLACK
+                    y.color = BLACK
+                    z.parent.parent.color = RED
                     z = z.parent.parent
                 else:
                     if z == z.parent.left:
                         z = z.parent
                         self.right_rotate(z)
 
-                    z.parent.color = "BLACK"
-                    z.parent.parent.color = "RED"
+                    z.parent.color = BLACK
+                    z.parent.parent.color = RED
                     self.left_rotate(z.parent.parent)
 
             if z == self.root:
                 break
 
-        self.root.color = "BLACK"
+        self.root.color = BLACK
 
     # -----------------------------------------------------
     # Insert
@@ -137,10 +133,23 @@ class RedBlackTree:
     # Inorder Traversal (to show balanced tree)
     # -----------------------------------------------------
     def inorder(self, node):
-        if node != self.NULL:
-            self.inorder(node.left)
-            print(f"{node.key} ({node.color})", end="  ")
-            self.inorder(node.right)
+        for n in inorder_nodes(node, self.NULL):
+            print(f"{n.key} ({color_name(n.color)})", end="  ")
+
+    def keys(self):
+        return [n.key for n in inorder_nodes(self.root, self.NULL)]
+
+    # -----------------------------------------------------
+    # Checkpoint / Restore (integer keys, see rbt_node)
+    # -----------------------------------------------------
+    def dumps(self):
+        return dump_tree(self.root, self.NULL)
+
+    @classmethod
+    def loads(cls, data):
+        tree = cls()
+        tree.root = load_tree(data, Node, tree.NULL)[0]
+        return tree
 
 
 # ---------------------------------------------------------
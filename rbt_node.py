@@ -0,0 +1,165 @@
+import struct
+import sys
+from array import array
+
+# ---------------------------------------------------------
+# Compact Red-Black Tree Node
+# (shared by rbt_insert, rbt_delete and rbt_vs_binomial)
+# ---------------------------------------------------------
+# __slots__ drops the per-instance __dict__ and colors are
+# booleans, so fixups test them by identity, not string ==
+RED = True
+BLACK = False
+
+
+class RBNode:
+    __slots__ = ("key", "color", "left", "right", "parent")
+
+    def __init__(self, key):
+        self.key = key
+        self.color = RED
+        self.left = None
+        self.right = None
+        self.parent = None
+
+
+def color_name(color):
+    return "RED" if color is RED else "BLACK"
+
+
+# ---------------------------------------------------------
+# Iterative traversals (no recursion, so deep or huge trees
+# never hit the recursion limit); NULL = the tree's sentinel
+# ---------------------------------------------------------
+def inorder_nodes(node, NULL):
+    stack = []
+    while stack or node != NULL:
+        if node != NULL:
+            stack.append(node)
+            node = node.left
+        else:
+            node = stack.pop()
+            yield node
+            node = node.right
+
+
+def preorder_nodes(node, NULL):
+    stack = [node] if node != NULL else []
+    while stack:
+        node = stack.pop()
+        yield node
+        if node.right != NULL:
+            stack.append(node.right)
+        if node.left != NULL:
+            stack.append(node.left)
+
+
+# ---------------------------------------------------------
+# Binary serialization (integer keys)
+#   header : b"RBT1", tree flags (1 = multiset), node count
+#   body   : int64 keys in preorder, one flag byte per node,
+#            then an int64 count for every node flagged COUNT
+# Preorder + has-left / has-right bits fix the shape, so
+# loading is a single pass with a stack: O(n)
+# ---------------------------------------------------------
+MAGIC = b"RBT1"
+HEADER = struct.Struct("<4sBQ")
+
+FLAG_RED = 1
+FLAG_LEFT = 2
+FLAG_RIGHT = 4
+FLAG_COUNT = 8
+
+
+def dump_tree(root, NULL, multiset=False):
+    keys = array("q")
+    flags = bytearray()
+    counts = array("q")
+
+    for node in preorder_nodes(root, NULL):
+        keys.append(node.key)
+        f = FLAG_RED if node.color is RED else 0
+        if node.left != NULL:
+            f |= FLAG_LEFT
+        if node.right != NULL:
+            f |= FLAG_RIGHT
+        count = getattr(node, "count", 1)
+        if count != 1:
+            f |= FLAG_COUNT
+            counts.append(count)
+        flags.append(f)
+
+    if sys.byteorder == "big":
+        keys.byteswap()
+        counts.byteswap()
+    return HEADER.pack(MAGIC, int(multiset), len(keys)) + keys.tobytes() + bytes(flags) + counts.tobytes()
+
+
+def load_tree(data, make_node, NULL):
+    """
+    Returns (root, nodes in preorder, multiset); parent pointers and
+    colors are restored, augmented fields (size) are left to the caller
+    """
+
+    if len(data) < HEADER.size:
+        raise ValueError("data too short for a red-black tree header")
+    magic, tree_flags, n = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("not a serialized red-black tree")
+
+    pos = HEADER.size
+    keys = array("q")
+    keys.frombytes(data[pos:pos + 8 * n])
+    pos += 8 * n
+    flags = data[pos:pos + n]
+    pos += n
+    if len(keys) != n or len(flags) != n or (len(data) - pos) % 8:
+        raise ValueError("truncated red-black tree data")
+    counts = array("q")
+    counts.frombytes(data[pos:])
+    if sys.byteorder == "big":
+        keys.byteswap()
+        counts.byteswap()
+
+    root = NULL
+    nodes = []
+    stack = []          # [node, child slots still to fill]
+    next_count = 0
+
+    for i in range(n):
+        node = make_node(keys[i])
+        f = flags[i]
+        node.color = RED if f & FLAG_RED else BLACK
+        node.left = NULL
+        node.right = NULL
+        if f & FLAG_COUNT:
+            if next_count == len(counts):
+                raise ValueError("truncated red-black tree data")
+            node.count = counts[next_count]
+            next_count += 1
+
+        if stack:
+            entry = stack[-1]
+            parent = entry[0]
+            if entry[1] & FLAG_LEFT:
+                parent.left = node
+                entry[1] &= ~FLAG_LEFT
+            else:
+                parent.right = node
+                entry[1] = 0
+            if not entry[1]:
+                stack.pop()
+            node.parent = parent
+        elif i == 0:
+            root = node
+            node.parent = None
+        else:
+            raise ValueError("corrupt red-black tree data (extra nodes)")
+
+        if f & (FLAG_LEFT | FLAG_RIGHT):
+            stack.append([node, f & (FLAG_LEFT | FLAG_RIGHT)])
+        nodes.append(node)
+
+    if stack or next_count != len(counts):
+        raise ValueError("corrupt red-black tree data (missing nodes)")
+    return root, nodes, bool(tree_flags & 1)
@@ -0,0 +1,226 @@
+import gc
+import random
+import time
+import tracemalloc
+
+from rbt_node import RBNode, RED, BLACK
+import rbt_insert
+import rbt_delete
+
+# ---------------------------------------------------------
+# Previous node layout: per-instance __dict__, string colors
+# ---------------------------------------------------------
+class DictNode:
+    def __init__(self, key):
+        self.key = key
+        self.color = "RED"
+        self.left = None
+        self.right = None
+        self.parent = None
+
+
+# ---------------------------------------------------------
+# Previous tree: rbt_insert as it was before the slotted node
+# (string color comparisons), with the root guard in the fixup
+# ---------------------------------------------------------
+class DictTree:
+    def __init__(self):
+        self.NULL = DictNode(0)
+        self.NULL.color = "BLACK"
+        self.root = self.NULL
+
+    def left_rotate(self, x):
+        y = x.right
+        x.right = y.left
+        if y.left != self.NULL:
+            y.left.parent = x
+        y.parent = x.parent
+        if x.parent is None:
+            self.root = y
+        elif x == x.parent.left:
+            x.parent.left = y
+        else:
+            x.parent.right = y
+        y.left = x
+        x.parent = y
+
+    def right_rotate(self, x):
+        y = x.left
+        x.left = y.right
+        if y.right != self.NULL:
+            y.right.parent = x
+        y.parent = x.parent
+        if x.parent is None:
+            self.root = y
+        elif x == x.parent.right:
+            x.parent.right = y
+        else:
+            x.parent.left = y
+        y.right = x
+        x.parent = y
+
+    def fix_insert(self, z):
+        while z != self.root and z.parent.color == "RED":
+            if z.parent == z.parent.parent.left:
+                y = z.parent.parent.right
+                if y.color == "RED":
+                    z.parent.color = "BLACK"
+                    y.color = "BLACK"
+                    z.parent.parent.color = "RED"
+                    z = z.parent.parent
+                else:
+                    if z == z.parent.right:
+                        z = z.parent
+                        self.left_rotate(z)
+                    z.parent.color = "BLACK"
+                    z.parent.parent.color = "RED"
+                    self.right_rotate(z.parent.parent)
+            else:
+                y = z.parent.parent.left
+                if y.color == "RED":
+                    z.parent.color = "BLACK"
+                    y.color = "BLACK"
+                    z.parent.parent.color = "RED"
+                    z = z.parent.parent
+                else:
+                    if z == z.parent.left:
+                        z = z.parent
+                        self.right_rotate(z)
+                    z.parent.color = "BLACK"
+                    z.parent.parent.color = "RED"
+                    self.left_rotate(z.parent.parent)
+        self.root.color = "BLACK"
+
+    def insert(self, key):
+        node = DictNode(key)
+        node.left = self.NULL
+        node.right = self.NULL
+
+        parent = None
+        current = self.root
+        while current != self.NULL:
+            parent = current
+            if node.key < current.key:
+                current = current.left
+            else:
+                current = current.right
+
+        node.parent = parent
+        if parent is None:
+            self.root = node
+        elif node.key < parent.key:
+            parent.left = node
+        else:
+            parent.right = node
+        self.fix_insert(node)
+
+
+# Same BST descent for every tree (rbt_insert has no search)
+def search(tree, key):
+    cur = tree.root
+    while cur != tree.NULL:
+        if key == cur.key:
+            return cur
+        cur = cur.left if key < cur.key else cur.right
+    return None
+
+
+# Inserts/sec and searches/sec of one tree on the same data
+# (cyclic GC off while timing, as timeit does: parent pointers
+#  make every tree a big cycle the collector keeps rescanning)
+def measure_tree(tree, data, queries):
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for x in data:
+            tree.insert(x)
+        insert_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for x in queries:
+            search(tree, x)
+        search_time = time.perf_counter() - start
+    finally:
+        gc.enable()
+
+    return len(data) / insert_time, len(queries) / search_time
+
+
+# ---------------------------------------------------------
+# Memory / allocation time for n nodes of a given class
+# ---------------------------------------------------------
+def measure_nodes(node_class, n):
+    tracemalloc.start()
+    start = time.perf_counter()
+    nodes = [node_class(i) for i in range(n)]
+    seconds = time.perf_counter() - start
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del nodes
+    return size, seconds
+
+
+# Color tests as done in every fixup step
+def measure_color_tests(nodes, red):
+    start = time.perf_counter()
+    count = 0
+    for node in nodes:
+        if node.color == red:
+            count += 1
+    return time.perf_counter() - start
+
+
+def measure_color_identity(nodes):
+    start = time.perf_counter()
+    count = 0
+    for node in nodes:
+        if node.color is RED:
+            count += 1
+    return time.perf_counter() - start
+
+
+# ---------------------------------------------------------
+# MAIN
+# ---------------------------------------------------------
+if __name__ == "__main__":
+    print("\n=== Red-Black Tree Node Layout: __dict__ vs __slots__ ===")
+
+    for n in [100000, 1000000]:
+        dict_mem, dict_time = measure_nodes(DictNode, n)
+        slot_mem, slot_time = measure_nodes(RBNode, n)
+        aug_mem, aug_time = measure_nodes(rbt_delete.Node, n)
+
+        print(f"\nNodes = {n}")
+        print("-------------------------------------------")
+        print(f"dict + str colors : {dict_mem / 2**20:8.1f} MiB  alloc {dict_time:.3f} sec")
+        print(f"slots + bool      : {slot_mem / 2**20:8.1f} MiB  alloc {slot_time:.3f} sec  (rbt_insert)")
+        print(f"+ size, count     : {aug_mem / 2**20:8.1f} MiB  alloc {aug_time:.3f} sec  (rbt_delete)")
+        print(f"Memory saved      : {100 * (1 - slot_mem / dict_mem):.0f}% / "
+              f"{100 * (1 - aug_mem / dict_mem):.0f}%")
+
+        dict_nodes = [DictNode(i) for i in range(n)]
+        for i, node in enumerate(dict_nodes):
+            node.color = "RED" if i % 2 else "BLACK"
+        slot_nodes = [RBNode(i) for i in range(n)]
+        for i, node in enumerate(slot_nodes):
+            node.color = RED if i % 2 else BLACK
+
+        print(f"color == \"RED\"    : {measure_color_tests(dict_nodes, 'RED'):.3f} sec")
+        print(f"color is RED      : {measure_color_identity(slot_nodes):.3f} sec")
+
+    print("\n=== RedBlackTree insert/search throughput (same data, same loop) ===")
+    trees = [
+        ("dict + str colors", DictTree),
+        ("slots + bool", rbt_insert.RedBlackTree),
+        ("+ size, count", rbt_delete.RedBlackTree),
+    ]
+    for n in [100000, 1000000]:
+        data = [random.randint(1, 10 * n) for _ in range(n)]
+        queries = data[:100000]
+
+        print(f"\nn = {n}")
+        print("-------------------------------------------")
+        for label, tree_class in trees:
+            inserts, searches = measure_tree(tree_class(), data, queries)
+            print(f"{label:18s}: {inserts:10.0f} inserts/sec, {searches:10.0f} searches/sec")
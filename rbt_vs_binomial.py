@@ -1,22 +1,18 @@
 import time
 import random
 
+from rbt_node import RBNode, RED, BLACK
+
 # ---------------------------------------------------------
 # (1) Red-Black Tree Implementation (Simplified Insert/Search/Delete)
 # ---------------------------------------------------------
 
-class RBTNode:
-    def __init__(self, key):
-        self.key = key
-        self.color = "RED"
-        self.left = None
-        self.right = None
-        self.parent = None
+RBTNode = RBNode     # compact slotted node, see rbt_node
 
 class RedBlackTree:
     def __init__(self):
         self.NULL = RBTNode(0)
-        self.NULL.color = "BLACK"
+        self.NULL.color = BLACK
         self.root = self.NULL
 
     # ---- Basic Insertion (same as Program 1) ----
@@ -75,36 +71,36 @@ class RedBlackTree:
         self.fix_insert(node)
 
     def fix_insert(self, z):
-        while z.parent.color == "RED":
+        while z != self.root and z.parent.color is RED:
             if z.parent == z.parent.parent.left:
                 y = z.parent.parent.right
-                if y.color == "RED":
-                    z.parent.color = "BLACK"
-                    y.color = "BLACK"
-                    z.parent.parent.color = "RED"
+                if y.color is RED:
+                    z.parent.color = BLACK
+                    y.color = BLACK
+                    z.parent.parent.color = RED
                     z = z.parent.parent
                 else:
                     if z == z.parent.right:
                         z = z.parent
                         self.left_rotate(z)
-                    z.parent.color = "BLACK"
-                    z.parent.parent.color = "RED"
+                    z.parent.color = BLACK
+                    z.parent.parent.color = RED
                     self.right_rotate(z.parent.parent)
             else:
                 y = z.parent.parent.left
-                if y.color == "RED":
-                    z.parent.color = "BLACK"
-                    y.color = "BLACK"
-                    z.parent.parent.color = "RED"
+                if y.color is RED:
+                    z.parent.color = BLACK
+                    y.color = BLACK
+                    z.parent.parent.color = RED
                     z = z.parent.parent
                 else:
                     if z == z.parent.left:
                         z = z.parent
                         self.right_rotate(z)
-                    z.parent.color = "BLACK"
-                    z.parent.parent.color = "RED"
+                    z.parent.color = BLACK
+                    z.parent.parent.color = RED
                     self.left_rotate(z.parent.parent)
-        self.root.color = "BLACK"
+        self.root.color = BLACK
 
     # ---- Simplified Search ----
     def search(self, key):
@@ -0,0 +1,64 @@
+import time
+import random
+
+from rbt_delete import RedBlackTree
+from block_index import BlockIndex
+
+# ---------------------------------------------------------
+# One workload run against any index with the
+# insert / in (search) / iter_range / delete API
+# ---------------------------------------------------------
+def run_workload(index, data, queries, ranges, deletes):
+    times = {}
+
+    start = time.time()
+    for x in data:
+        index.insert(x)
+    times["insert"] = time.time() - start
+
+    start = time.time()
+    hits = sum(1 for q in queries if q in index)
+    times["search"] = time.time() - start
+
+    start = time.time()
+    scanned = sum(sum(1 for _ in index.iter_range(lo, hi)) for lo, hi in ranges)
+    times["range"] = time.time() - start
+
+    start = time.time()
+    for x in deletes:
+        index.delete(x)
+    times["delete"] = time.time() - start
+
+    return times, hits, scanned
+
+
+# ---------------------------------------------------------
+# MAIN – User Input & Performance Measurement
+# ---------------------------------------------------------
+if __name__ == "__main__":
+    print("\n=== RBT vs Block Index Performance Comparison ===")
+
+    n = int(input("Enter number of random elements: "))
+
+    data = random.sample(range(10 * n), n)
+    queries = [random.randrange(10 * n) for _ in range(100000)]
+    ranges = [(lo, lo + 1000) for lo in (random.randrange(10 * n) for _ in range(1000))]
+    deletes = random.sample(data, n // 10)
+
+    rbt_times, rbt_hits, rbt_scanned = run_workload(RedBlackTree(), data, queries, ranges, deletes)
+    blk_times, blk_hits, blk_scanned = run_workload(BlockIndex(), data, queries, ranges, deletes)
+
+    # Output
+    print("\n--- Performance Results ---")
+    print(f"Input Size = {n}, {len(queries)} searches, {len(ranges)} range scans, {len(deletes)} deletes")
+    print("---------------------------------------------------")
+    print(f"{'operation':10s} {'RBT (sec)':>12s} {'Block (sec)':>12s} {'speedup':>9s}")
+    for op in ("insert", "search", "range", "delete"):
+        speedup = rbt_times[op] / blk_times[op] if blk_times[op] else float("inf")
+        print(f"{op:10s} {rbt_times[op]:12.6f} {blk_times[op]:12.6f} {speedup:8.1f}x")
+    print("---------------------------------------------------")
+    print("Same answers:", rbt_hits == blk_hits and rbt_scanned == blk_scanned)
+
+    print("\nConclusion:")
+    print("✔ Both give O(log n) search and ordered range scans")
+    print("✔ Block Index replaces per-level pointer hops with bisect over contiguous lists")